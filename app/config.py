@@ -39,6 +39,11 @@ class Settings(BaseSettings):
     NEO4J_URL: str
     NEO4J_USERNAME: str
     NEO4J_PASSWORD: str
+    NEO4J_MAX_CONNECTION_POOL_SIZE: int = 100
+    NEO4J_CONNECTION_ACQUISITION_TIMEOUT: float = 60.0  # Seconds to wait for a pooled connection
+    NEO4J_MAX_CONNECTION_LIFETIME: float = 3600.0       # Seconds before a connection is recycled
+    NEO4J_KEEP_ALIVE: bool = True                       # TCP keep-alive on driver connections
+    NEO4J_NAME_FULLTEXT_INDEX: str = ""  # Full-text index on name; empty scans instead
 
     # SQLite Database Settings (Required)
     DATABASE_PATH: str
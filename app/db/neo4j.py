@@ -4,10 +4,18 @@ Implements a singleton driver pattern using FastAPI's lifespan context manager.
 Uses the official neo4j Python driver with AsyncGraphDatabase.
 """
 
+from collections.abc import AsyncGenerator, Callable
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
 
-from neo4j import AsyncGraphDatabase, AsyncDriver
+from neo4j import (
+    READ_ACCESS,
+    WRITE_ACCESS,
+    AsyncDriver,
+    AsyncGraphDatabase,
+    AsyncSession,
+    Record,
+    RoutingControl,
+)
 
 from app.config import get_settings
 
@@ -25,6 +33,10 @@ class Neo4jConnection:
             cls._driver = AsyncGraphDatabase.driver(
                 settings.NEO4J_URL,
                 auth=(settings.NEO4J_USERNAME, settings.NEO4J_PASSWORD),
+                max_connection_pool_size=settings.NEO4J_MAX_CONNECTION_POOL_SIZE,
+                connection_acquisition_timeout=settings.NEO4J_CONNECTION_ACQUISITION_TIMEOUT,
+                max_connection_lifetime=settings.NEO4J_MAX_CONNECTION_LIFETIME,
+                keep_alive=settings.NEO4J_KEEP_ALIVE,
             )
         return cls._driver
 
@@ -47,21 +59,39 @@ class Neo4jConnection:
 
 
 @asynccontextmanager
-async def get_session() -> AsyncGenerator:
+async def get_session(access_mode: str = WRITE_ACCESS) -> AsyncGenerator:
     """Get a Neo4j session for database operations.
 
+    Args:
+        access_mode: READ_ACCESS or WRITE_ACCESS for the session's transactions.
+
     Usage:
         async with get_session() as session:
             result = await session.run("MATCH (n) RETURN n LIMIT 1")
     """
     driver = await Neo4jConnection.get_driver()
-    session = driver.session()
+    session = driver.session(default_access_mode=access_mode)
     try:
         yield session
     finally:
         await session.close()
 
 
+async def get_neo4j_session() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency providing a read-only Neo4j session for the current request.
+
+    The routes using it only read, and the Cypher API runs user-supplied
+    queries on it, so the server is asked to reject any write. The session is
+    closed once the request is done. Tests replace it through
+    app.dependency_overrides.
+
+    Yields:
+        A Neo4j AsyncSession in READ_ACCESS mode.
+    """
+    async with get_session(READ_ACCESS) as session:
+        yield session
+
+
 async def execute_query(query: str, parameters: dict | None = None) -> list[dict]:
     """Execute a Cypher query and return results as a list of dictionaries.
 
@@ -92,3 +122,83 @@ async def execute_query_single(query: str, parameters: dict | None = None) -> di
         result = await session.run(query, parameters or {})
         record = await result.single()
         return dict(record) if record else None
+
+
+async def execute_read(query: str, parameters: dict | None = None) -> list[Record]:
+    """Execute a read-only Cypher query as a single managed transaction.
+
+    Uses the driver's execute_query API, which runs on a pooled connection
+    without the bookkeeping of an explicitly opened session. Suited to small
+    queries whose results fit comfortably in memory.
+
+    Args:
+        query: The Cypher query to execute.
+        parameters: Optional parameters for the query.
+
+    Returns:
+        List of records returned by the query.
+    """
+    driver = await Neo4jConnection.get_driver()
+    records, _, _ = await driver.execute_query(
+        query,
+        parameters or {},
+        routing_=RoutingControl.READ,
+    )
+    return records
+
+
+async def execute_read_values(query: str, key: str, parameters: dict | None = None) -> list:
+    """Execute a read-only Cypher query and return a single column of its results.
+
+    Like execute_read(), but the driver collects the values of one key directly
+    instead of materializing a Record per row.
+
+    Args:
+        query: The Cypher query to execute.
+        key: The record key whose values are returned.
+        parameters: Optional parameters for the query.
+
+    Returns:
+        List of values for the given key, one per record.
+    """
+    driver = await Neo4jConnection.get_driver()
+    return await driver.execute_query(
+        query,
+        parameters or {},
+        routing_=RoutingControl.READ,
+        result_transformer_=lambda result: result.value(key),
+    )
+
+
+async def execute_read_map[T](
+    query: str,
+    key: str,
+    func: Callable[..., T],
+    parameters: dict | None = None,
+) -> list[T]:
+    """Execute a read-only Cypher query and convert one column as records stream in.
+
+    Like execute_read_values(), but func is applied to each value while the
+    result is consumed. The raw values are never collected into a list, and
+    conversion overlaps with receiving the remaining records.
+
+    Args:
+        query: The Cypher query to execute.
+        key: The record key whose values are converted.
+        func: Conversion applied to each value.
+        parameters: Optional parameters for the query.
+
+    Returns:
+        List of converted values, one per record.
+    """
+
+    async def transform(result) -> list[T]:
+        return [func(record[key]) async for record in result]
+
+    driver = await Neo4jConnection.get_driver()
+    return await driver.execute_query(
+        query,
+        parameters or {},
+        routing_=RoutingControl.READ,
+        result_transformer_=transform,
+    )
@@ -3,11 +3,13 @@
 Network Investigation Backend API connecting to Neo4j Aura.
 """
 
+import time
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from sqlmodel import Session, select
 
 from app.config import get_settings
@@ -16,9 +18,13 @@ from app.db.session import init_db, init_flag_db, get_engine, FLAG_DATABASE_PATH
 from app.models import HealthResponse
 from app.models.user import User
 from app.auth.security import get_password_hash
-from app.routers import search, network, cypher, flag
+from app.routers import search, network, cypher, flag, admin
 from app.api.auth import router as auth_router
 
+# Health probes reuse a recent connectivity check for this many seconds
+_HEALTH_CACHE_TTL = 2.0
+_health_cache: tuple[float, bool] | None = None
+
 
 def bootstrap_admin_user() -> None:
     """Create the first admin user if no users exist.
@@ -50,6 +56,23 @@ def bootstrap_admin_user() -> None:
             print(f"ℹ️ Users already exist, skipping admin bootstrap")
 
 
+async def _cached_verify_connectivity() -> bool:
+    """Verify the Neo4j connection, reusing a result younger than the cache TTL.
+
+    Load balancer probes can hit /health and /ready far more often than the
+    connection state changes, so consecutive probes share one check.
+    """
+    global _health_cache
+
+    now = time.monotonic()
+    if _health_cache is not None and now - _health_cache[0] < _HEALTH_CACHE_TTL:
+        return _health_cache[1]
+
+    connected = await Neo4jConnection.verify_connectivity()
+    _health_cache = (now, connected)
+    return connected
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator:
     """Manage application lifespan events.
@@ -143,12 +166,16 @@ Authorization: Bearer <your_token>
         allow_headers=settings.CORS_ALLOW_HEADERS,
     )
 
+    # Compress larger responses; search and subgraph JSON repeats keys per node
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
     # Include routers
     app.include_router(auth_router, prefix="/api/v1")
     app.include_router(search.router, prefix="/api/v1")
     app.include_router(network.router, prefix="/api/v1")
     app.include_router(cypher.router, prefix="/api/v1")
     app.include_router(flag.router, prefix="/api/v1")
+    app.include_router(admin.router, prefix="/api/v1")
 
     return app
 
@@ -156,14 +183,16 @@ Authorization: Bearer <your_token>
 # Create the application instance
 app = create_app()
 
+# Settings are immutable after startup, so bind them once for the hot endpoints
+SETTINGS = get_settings()
+
 
 @app.get("/", tags=["root"])
 async def root() -> dict:
     """Root endpoint returning API information."""
-    settings = get_settings()
     return {
-        "name": settings.APP_NAME,
-        "version": settings.APP_VERSION,
+        "name": SETTINGS.APP_NAME,
+        "version": SETTINGS.APP_VERSION,
         "docs": "/docs",
         "redoc": "/redoc",
         "openapi": "/openapi.json",
@@ -173,10 +202,8 @@ async def root() -> dict:
 @app.get("/health", response_model=HealthResponse, tags=["health"])
 async def health_check() -> HealthResponse:
     """Health check endpoint for monitoring and load balancers."""
-    settings = get_settings()
-
     try:
-        db_connected = await Neo4jConnection.verify_connectivity()
+        db_connected = await _cached_verify_connectivity()
         db_status = "connected" if db_connected else "disconnected"
     except Exception:
         db_status = "error"
@@ -184,7 +211,7 @@ async def health_check() -> HealthResponse:
     return HealthResponse(
         status="healthy" if db_status == "connected" else "degraded",
         database=db_status,
-        version=settings.APP_VERSION,
+        version=SETTINGS.APP_VERSION,
     )
 
 
@@ -192,7 +219,7 @@ async def health_check() -> HealthResponse:
 async def readiness_check() -> dict:
     """Readiness check for Kubernetes/Cloud Run."""
     try:
-        connected = await Neo4jConnection.verify_connectivity()
+        connected = await _cached_verify_connectivity()
         if connected:
             return {"status": "ready"}
         else:
@@ -13,6 +13,7 @@ from app.models.graph import (
     NodeLabel,
     RelationshipType,
     RelationshipsResponse,
+    SearchByIdsRequest,
     SearchResponse,
     SubgraphResponse,
 )
@@ -33,6 +34,7 @@ __all__ = [
     "NodeLabel",
     "RelationshipType",
     "RelationshipsResponse",
+    "SearchByIdsRequest",
     "SearchResponse",
     "SubgraphResponse",
     # User models
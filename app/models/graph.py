@@ -122,29 +122,49 @@ class AddressNode(NodeBase):
 # =============================================================================
 
 class GraphNode(BaseModel):
-    """Node representation for graph visualization."""
+    """Node representation for graph visualization.
 
-    id: str = Field(..., description="Unique identifier (element_id from Neo4j)")
-    node_id: int = Field(..., description="Node ID property")
-    label: str = Field(..., description="Node label (officer, entity, intermediary, address)")
-    properties: dict[str, Any] = Field(default_factory=dict, description="Node properties")
+    Attributes:
+        id: Unique identifier (element_id from Neo4j).
+        node_id: Node ID property.
+        label: Node label (officer, entity, intermediary, address).
+        properties: Node properties.
+    """
+
+    id: str
+    node_id: int
+    label: str
+    properties: dict[str, Any] = {}
 
 
 class GraphLink(BaseModel):
-    """Link/Edge representation for graph visualization."""
+    """Link/Edge representation for graph visualization.
+
+    Attributes:
+        id: Unique identifier (element_id from Neo4j).
+        source: Source node element_id.
+        target: Target node element_id.
+        type: Relationship type.
+        properties: Relationship properties.
+    """
 
-    id: str = Field(..., description="Unique identifier (element_id from Neo4j)")
-    source: str = Field(..., description="Source node element_id")
-    target: str = Field(..., description="Target node element_id")
-    type: str = Field(..., description="Relationship type")
-    properties: dict[str, Any] = Field(default_factory=dict, description="Relationship properties")
+    id: str
+    source: str
+    target: str
+    type: str
+    properties: dict[str, Any] = {}
 
 
 class SubgraphResponse(BaseModel):
-    """Response model for subgraph queries."""
+    """Response model for subgraph queries.
 
-    nodes: list[GraphNode] = Field(default_factory=list, description="List of nodes")
-    links: list[GraphLink] = Field(default_factory=list, description="List of links/edges")
+    Attributes:
+        nodes: List of nodes.
+        links: List of links/edges.
+    """
+
+    nodes: list[GraphNode] = []
+    links: list[GraphLink] = []
 
 
 class RelationshipsResponse(BaseModel):
@@ -166,6 +186,13 @@ class SearchRequest(BaseModel):
     limit: int = Field(default=100, ge=1, le=1000, description="Maximum results to return")
 
 
+class SearchByIdsRequest(BaseModel):
+    """Request model for looking up several nodes by node_id at once."""
+
+    node_ids: list[int] = Field(..., min_length=1, max_length=1000, description="node_ids to look up")
+    label: NodeLabel | None = Field(None, description="Filter by node label")
+
+
 class SearchResponse(BaseModel):
     """Response model for node search."""
 
@@ -209,8 +236,14 @@ class CypherResponse(BaseModel):
 # =============================================================================
 
 class HealthResponse(BaseModel):
-    """Response model for health check endpoint."""
+    """Response model for health check endpoint.
+
+    Attributes:
+        status: Service status.
+        database: Database connection status.
+        version: API version.
+    """
 
-    status: str = Field(..., description="Service status")
-    database: str = Field(..., description="Database connection status")
-    version: str = Field(..., description="API version")
+    status: str
+    database: str
+    version: str
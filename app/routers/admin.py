@@ -0,0 +1,37 @@
+"""Admin API router for operational tasks."""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+
+from app.auth.dependencies import get_current_admin_user
+from app.models.user import User
+from app.routers.cypher import clear_schema_cache
+from app.routers.search import clear_search_caches
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.post(
+    "/cache/invalidate",
+    summary="Invalidate in-process caches",
+    description=(
+        "Clear cached search results and the cached database schema of the instance "
+        "handling the request, e.g. after writing to Neo4j. Requires admin privileges."
+    ),
+)
+async def invalidate_caches(
+    current_user: Annotated[User, Depends(get_current_admin_user)],
+) -> dict:
+    """Clear the search result caches and the schema cache of this process.
+
+    Args:
+        current_user: The authenticated admin user (injected by dependency).
+
+    Returns:
+        Success message with the number of search results removed.
+    """
+    count = clear_search_caches()
+    clear_schema_cache()
+
+    return {"message": f"Cleared {count} cached search result(s) and the schema cache"}
@@ -1,18 +1,57 @@
 """Async Cypher Query API router for executing arbitrary queries."""
 
+import asyncio
+import re
+import time
 from collections import defaultdict
+from operator import itemgetter
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException
+from neo4j import AsyncSession
+from neo4j.graph import Node, Path, Relationship
 from pydantic import BaseModel, Field
 
-from app.db.neo4j import get_session
+from app.db.neo4j import execute_read, execute_read_values, get_neo4j_session
 from app.models.user import User
 from app.models.graph import GraphNode, GraphLink, SubgraphResponse
 from app.auth.dependencies import get_current_active_user
+from app.routers.network import process_node
 
 router = APIRouter(prefix="/cypher", tags=["cypher"])
 
+# Potentially dangerous operations blocked in user-supplied queries.
+# Longer phrases come first so the alternation matches the most specific keyword,
+# e.g. DETACH DELETE rather than DELETE.
+_DANGEROUS_KEYWORDS = (
+    "DETACH DELETE",
+    "DELETE",
+    "DROP INDEX",
+    "DROP CONSTRAINT",
+    "DROP",
+    "CREATE INDEX",
+    "CREATE CONSTRAINT",
+)
+_DANGEROUS_RE = re.compile(
+    r"\b(" + "|".join(kw.replace(" ", r"\s+") for kw in _DANGEROUS_KEYWORDS) + r")\b",
+    re.IGNORECASE,
+)
+
+# Procedure calls can run Cypher passed in as a string, e.g. apoc.cypher.doIt
+_CALL_RE = re.compile(r"\bCALL\b", re.IGNORECASE)
+
+_QUOTES = "'\"`"
+
+# Query prefixes identifying read operations
+_READ_PREFIX_RE = re.compile(
+    r"^(?:MATCH|OPTIONAL\s+MATCH|WITH|UNWIND|CALL|RETURN)\b",
+    re.IGNORECASE,
+)
+
+# Schema changes rarely, so cache it in-process for a short time
+_SCHEMA_CACHE_TTL = 60.0
+_schema_cache: tuple[float, dict] | None = None
+
 
 class CypherRequest(BaseModel):
     """Request model for Cypher query execution."""
@@ -36,132 +75,87 @@ class ConnectedComponentsResponse(BaseModel):
     component_count: int = Field(default=0, description="Number of connected components")
 
 
-def _serialize_neo4j_value(value: Any) -> Any:
-    """Serialize Neo4j-specific types to JSON-compatible values.
-
-    Args:
-        value: A value from Neo4j query result.
-
-    Returns:
-        JSON-serializable value.
-    """
-    if value is None:
-        return None
-
-    # Handle Neo4j Node
-    if hasattr(value, 'element_id') and hasattr(value, 'labels'):
-        return {
-            "_type": "node",
-            "element_id": value.element_id,
-            "labels": list(value.labels),
-            "properties": dict(value),
-        }
-
-    # Handle Neo4j Relationship
-    if hasattr(value, 'element_id') and hasattr(value, 'type'):
-        return {
-            "_type": "relationship",
-            "element_id": value.element_id,
-            "type": value.type,
-            "start_node_element_id": value.start_node.element_id if value.start_node else None,
-            "end_node_element_id": value.end_node.element_id if value.end_node else None,
-            "properties": dict(value),
-        }
-
-    # Handle Neo4j Path
-    if hasattr(value, 'nodes') and hasattr(value, 'relationships'):
-        return {
-            "_type": "path",
-            "nodes": [_serialize_neo4j_value(n) for n in value.nodes],
-            "relationships": [_serialize_neo4j_value(r) for r in value.relationships],
-        }
-
-    # Handle lists
-    if isinstance(value, list):
-        return [_serialize_neo4j_value(v) for v in value]
-
-    # Handle dicts
-    if isinstance(value, dict):
-        return {k: _serialize_neo4j_value(v) for k, v in value.items()}
-
-    # Return primitive values as-is
-    return value
-
-
-def _serialize_record(record: dict) -> dict:
-    """Serialize a Neo4j record to a JSON-compatible dictionary.
-
-    Args:
-        record: A record from Neo4j query result.
-
-    Returns:
-        JSON-serializable dictionary.
-    """
-    return {key: _serialize_neo4j_value(value) for key, value in record.items()}
-
+def _extract_graph_elements(
+    value: Any,
+    nodes: dict,
+    links: dict,
+    seen: set[int] | None = None,
+) -> None:
+    """Extract nodes and relationships from a Neo4j value.
 
-def _extract_graph_elements(value: Any, nodes: dict, links: dict) -> None:
-    """Extract nodes and relationships from a Neo4j value recursively.
+    Nested values are walked with an explicit stack rather than recursion.
+    Children are pushed in reverse so they are visited in their original order.
 
     Args:
         value: A value from Neo4j query result.
         nodes: Dictionary to store extracted nodes (keyed by element_id).
         links: Dictionary to store extracted links (keyed by element_id).
+        seen: Object ids of graph elements already visited. Share one set across
+            the values of a result so repeated nodes and relationships are skipped
+            before any type dispatch. The values must stay alive while it is in use.
     """
-    if value is None:
-        return
-
-    # Handle Neo4j Node
-    if hasattr(value, 'element_id') and hasattr(value, 'labels'):
-        if value.element_id not in nodes:
-            properties = dict(value)
-            node_id = properties.pop("node_id", 0)
-            labels = list(value.labels)
-            label = labels[0] if labels else "Unknown"
-            nodes[value.element_id] = GraphNode(
-                id=value.element_id,
-                node_id=node_id,
-                label=label,
-                properties=properties,
-            )
-        return
-
-    # Handle Neo4j Relationship
-    if hasattr(value, 'element_id') and hasattr(value, 'type'):
-        if value.element_id not in links:
-            links[value.element_id] = GraphLink(
-                id=value.element_id,
-                source=value.start_node.element_id if value.start_node else "",
-                target=value.end_node.element_id if value.end_node else "",
-                type=value.type,
-                properties=dict(value) if hasattr(value, 'items') else {},
-            )
-            # Also extract start and end nodes
-            if value.start_node:
-                _extract_graph_elements(value.start_node, nodes, links)
-            if value.end_node:
-                _extract_graph_elements(value.end_node, nodes, links)
-        return
-
-    # Handle Neo4j Path
-    if hasattr(value, 'nodes') and hasattr(value, 'relationships'):
-        for node in value.nodes:
-            _extract_graph_elements(node, nodes, links)
-        for rel in value.relationships:
-            _extract_graph_elements(rel, nodes, links)
-        return
-
-    # Handle lists
-    if isinstance(value, list):
-        for item in value:
-            _extract_graph_elements(item, nodes, links)
-        return
-
-    # Handle dicts
-    if isinstance(value, dict):
-        for v in value.values():
-            _extract_graph_elements(v, nodes, links)
-        return
+    if seen is None:
+        seen = set()
+
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if value is None or id(value) in seen:
+            continue
+
+        # Handle Neo4j Node
+        if isinstance(value, Node):
+            seen.add(id(value))
+            if value.element_id not in nodes:
+                nodes[value.element_id] = process_node(value)
+            continue
+
+        # Handle Neo4j Relationship
+        if isinstance(value, Relationship):
+            seen.add(id(value))
+            if value.element_id not in links:
+                links[value.element_id] = GraphLink.model_construct(
+                    id=value.element_id,
+                    source=value.start_node.element_id if value.start_node is not None else "",
+                    target=value.end_node.element_id if value.end_node is not None else "",
+                    type=value.type,
+                    properties=dict(value.items()),
+                )
+                # Also extract start and end nodes. Nodes without properties
+                # are falsy, so test for None explicitly.
+                if value.end_node is not None:
+                    stack.append(value.end_node)
+                if value.start_node is not None:
+                    stack.append(value.start_node)
+            continue
+
+        # Handle Neo4j Path
+        if isinstance(value, Path):
+            seen.add(id(value))
+            stack.extend(reversed(value.relationships))
+            stack.extend(reversed(value.nodes))
+            continue
+
+        # Handle lists
+        if isinstance(value, list):
+            stack.extend(reversed(value))
+            continue
+
+        # Handle dicts
+        if isinstance(value, dict):
+            stack.extend(reversed(value.values()))
+            continue
+
+
+def _is_quoted_value(query: str, match: re.Match) -> bool:
+    """Return True if a keyword match is the whole of a quoted string or name, e.g. 'delete'."""
+    start, end = match.span()
+    return (
+        0 < start
+        and end < len(query)
+        and query[start - 1] in _QUOTES
+        and query[end] == query[start - 1]
+    )
 
 
 def _find_connected_components(
@@ -182,16 +176,30 @@ def _find_connected_components(
 
     # Union-Find data structure
     parent: dict[str, str] = {node_id: node_id for node_id in nodes}
+    rank: dict[str, int] = dict.fromkeys(nodes, 0)
 
     def find(x: str) -> str:
-        if parent[x] != x:
-            parent[x] = find(parent[x])  # Path compression
-        return parent[x]
+        # Iterative to avoid recursion limits on long chains
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        # Path compression
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
 
     def union(x: str, y: str) -> None:
         px, py = find(x), find(y)
-        if px != py:
+        if px == py:
+            return
+        # Union by rank: attach the shallower tree under the deeper one
+        if rank[px] < rank[py]:
             parent[px] = py
+        elif rank[px] > rank[py]:
+            parent[py] = px
+        else:
+            parent[py] = px
+            rank[px] += 1
 
     # Build connections from links
     for link in links.values():
@@ -201,32 +209,74 @@ def _find_connected_components(
             union(source, target)
 
     # Group nodes by their root
-    components: dict[str, list[str]] = defaultdict(list)
-    for node_id in nodes:
-        root = find(node_id)
-        components[root].append(node_id)
+    comp_nodes: dict[str, list[GraphNode]] = defaultdict(list)
+    for node_id, node in nodes.items():
+        comp_nodes[find(node_id)].append(node)
+
+    # Bucket links by the root of their endpoints in a single pass
+    comp_links: dict[str, list[GraphLink]] = defaultdict(list)
+    for link in links.values():
+        if link.source in nodes and link.target in nodes:
+            comp_links[find(link.source)].append(link)
+
+    # Sort by component size (largest first) before building the responses
+    sized = [
+        (len(component_nodes), component_nodes, comp_links[root])
+        for root, component_nodes in comp_nodes.items()
+    ]
+    sized.sort(key=itemgetter(0), reverse=True)
 
     # Build SubgraphResponse for each component
-    result: list[SubgraphResponse] = []
-    for component_node_ids in components.values():
-        component_nodes = [nodes[nid] for nid in component_node_ids]
-        component_node_set = set(component_node_ids)
+    return [
+        SubgraphResponse.model_construct(nodes=component_nodes, links=component_links)
+        for _, component_nodes, component_links in sized
+    ]
 
-        # Find links where both endpoints are in this component
-        component_links = [
-            link for link in links.values()
-            if link.source in component_node_set and link.target in component_node_set
-        ]
 
-        result.append(SubgraphResponse(
-            nodes=component_nodes,
-            links=component_links,
-        ))
+async def _fetch_schema() -> dict:
+    """Fetch node labels, relationship types and property keys from Neo4j.
+
+    Returns:
+        Dictionary containing node labels, relationship types, and property keys.
+    """
+    labels, relationship_types, property_keys = await asyncio.gather(
+        execute_read_values("CALL db.labels()", "label"),
+        execute_read_values("CALL db.relationshipTypes()", "relationshipType"),
+        execute_read_values("CALL db.propertyKeys()", "propertyKey"),
+    )
+
+    return {
+        "node_labels": labels,
+        "relationship_types": relationship_types,
+        "property_keys": property_keys,
+    }
+
+
+async def _get_schema_cached(ttl: float = _SCHEMA_CACHE_TTL) -> dict:
+    """Return the database schema, refetching it once the cached copy expires.
+
+    Args:
+        ttl: Number of seconds a fetched schema stays valid.
+
+    Returns:
+        Dictionary containing node labels, relationship types, and property keys.
+    """
+    global _schema_cache
+
+    now = time.monotonic()
+    if _schema_cache is not None and now - _schema_cache[0] < ttl:
+        return _schema_cache[1]
+
+    schema = await _fetch_schema()
+    _schema_cache = (now, schema)
+    return schema
 
-    # Sort by component size (largest first)
-    result.sort(key=lambda c: len(c.nodes), reverse=True)
 
-    return result
+def clear_schema_cache() -> None:
+    """Drop the cached schema so the next request refetches it."""
+    global _schema_cache
+
+    _schema_cache = None
 
 
 @router.post(
@@ -238,12 +288,14 @@ def _find_connected_components(
 async def execute_cypher(
     request: CypherRequest,
     current_user: Annotated[User, Depends(get_current_active_user)],
+    session: Annotated[AsyncSession, Depends(get_neo4j_session)],
 ) -> ConnectedComponentsResponse:
     """Execute an arbitrary Cypher query.
 
     Args:
         request: CypherRequest containing the query and optional parameters.
         current_user: The authenticated user (injected by dependency).
+        session: Neo4j session for the request (injected by dependency).
 
     Returns:
         ConnectedComponentsResponse with nodes and links grouped by connected components.
@@ -256,41 +308,47 @@ async def execute_cypher(
     if not query:
         raise HTTPException(status_code=400, detail="Query cannot be empty")
 
-    # Block potentially dangerous operations in queries
-    dangerous_keywords = ["DELETE", "DETACH DELETE", "DROP", "CREATE INDEX", "DROP INDEX", "CREATE CONSTRAINT", "DROP CONSTRAINT"]
-    query_upper = query.upper()
-
-    for keyword in dangerous_keywords:
-        # Check if keyword appears as a statement (not just in a string)
-        if keyword in query_upper:
-            # Allow if it's just a MATCH...RETURN query that happens to contain DELETE in a property value
-            if not any(query_upper.startswith(k) for k in ["MATCH", "OPTIONAL MATCH", "WITH", "UNWIND", "CALL", "RETURN"]):
-                raise HTTPException(
-                    status_code=403,
-                    detail=f"Query contains forbidden operation: {keyword}. Only read operations are allowed."
-                )
-            # Additional check for DELETE/DROP as standalone operations
-            if keyword in query_upper.split():
-                raise HTTPException(
-                    status_code=403,
-                    detail=f"Query contains forbidden operation: {keyword}. Only read operations are allowed."
-                )
+    # Block potentially dangerous operations in queries. A read query may use a
+    # keyword as a whole quoted value (e.g. n.status = 'delete'); every other
+    # occurrence counts as an operation, and so does any occurrence in a query
+    # calling procedures. The session is also read-only, so the server rejects
+    # writes this check cannot see.
+    allow_values = _READ_PREFIX_RE.match(query) is not None and _CALL_RE.search(query) is None
+    found = {
+        " ".join(m.group(1).upper().split())
+        for m in _DANGEROUS_RE.finditer(query)
+        if not (allow_values and _is_quoted_value(query, m))
+    }
+    if found:
+        keywords = ", ".join(kw for kw in _DANGEROUS_KEYWORDS if kw in found)
+        raise HTTPException(
+            status_code=403,
+            detail=(
+                f"Query contains forbidden operation: {keywords}. "
+                "Only read operations are allowed."
+            ),
+        )
 
     try:
         nodes: dict[str, GraphNode] = {}
         links: dict[str, GraphLink] = {}
 
-        async with get_session() as session:
-            result = await session.run(query, request.parameters)
-            # Extract graph elements from all records
-            async for record in result:
-                for value in record.values():
-                    _extract_graph_elements(value, nodes, links)
+        result = await session.run(query, request.parameters)
+        # Fetch all record values in one call instead of awaiting per record
+        rows = await result.values()
+
+        # Extract graph elements from all records. The driver reuses the same
+        # Node/Relationship objects across records, so share the visited set.
+        seen: set[int] = set()
+        for row in rows:
+            for value in row:
+                _extract_graph_elements(value, nodes, links, seen)
 
         # Find connected components
         components = _find_connected_components(nodes, links)
 
-        return ConnectedComponentsResponse(
+        # Components are built from already constructed models, so skip revalidation
+        return ConnectedComponentsResponse.model_construct(
             components=components,
             total_nodes=len(nodes),
             total_links=len(links),
@@ -325,34 +383,8 @@ async def get_schema(
     Returns:
         Dictionary containing node labels, relationship types, and their properties.
     """
-    # Get node labels
-    labels_query = "CALL db.labels()"
-
-    # Get relationship types
-    rel_types_query = "CALL db.relationshipTypes()"
-
-    # Get property keys
-    property_keys_query = "CALL db.propertyKeys()"
-
     try:
-        async with get_session() as session:
-            # Fetch labels
-            labels_result = await session.run(labels_query)
-            labels = [record["label"] async for record in labels_result]
-
-            # Fetch relationship types
-            rel_result = await session.run(rel_types_query)
-            relationship_types = [record["relationshipType"] async for record in rel_result]
-
-            # Fetch property keys
-            props_result = await session.run(property_keys_query)
-            property_keys = [record["propertyKey"] async for record in props_result]
-
-        return {
-            "node_labels": labels,
-            "relationship_types": relationship_types,
-            "property_keys": property_keys,
-        }
+        return await _get_schema_cached()
 
     except Exception as e:
         raise HTTPException(
@@ -385,20 +417,18 @@ async def get_stats(
     """
 
     try:
-        async with get_session() as session:
-            result = await session.run(stats_query)
-            record = await result.single()
-
-            if record:
-                return {
-                    "node_count": record["nodeCount"],
-                    "relationship_count": record["relationshipCount"],
-                }
-            else:
-                return {
-                    "node_count": 0,
-                    "relationship_count": 0,
-                }
+        records = await execute_read(stats_query)
+
+        if records:
+            return {
+                "node_count": records[0]["nodeCount"],
+                "relationship_count": records[0]["relationshipCount"],
+            }
+        else:
+            return {
+                "node_count": 0,
+                "relationship_count": 0,
+            }
 
     except Exception as e:
         raise HTTPException(
@@ -3,8 +3,10 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from neo4j import AsyncSession
+from neo4j.graph import Node
 
-from app.db.neo4j import get_session
+from app.db.neo4j import get_neo4j_session
 from app.models import (
     GraphLink,
     GraphNode,
@@ -18,22 +20,54 @@ from app.config import get_settings
 
 router = APIRouter(prefix="/network", tags=["network"])
 
+# Neighbor and shortest-path queries vary only by a label or hop count drawn from
+# a fixed set, so build every variant once instead of formatting per request.
+_NEIGHBORS_QUERY = """
+MATCH (start {{node_id: $node_id}})-[r]-(neighbor{label})
+RETURN start, r, neighbor
+LIMIT $limit
+"""
 
-def _process_node(node) -> GraphNode:
+_NEIGHBORS_QUERIES: dict[NodeLabel | None, str] = {
+    label: _NEIGHBORS_QUERY.format(label=f":`{label.value}`" if label else "")
+    for label in (None, *NodeLabel)
+}
+
+_SHORTEST_PATH_MAX_HOPS = 10
+
+_SHORTEST_PATH_QUERY = """
+MATCH path = shortestPath(
+    (start {{node_id: $start_node_id}})-[*1..{max_hops}]-(end {{node_id: $end_node_id}})
+)
+RETURN path
+"""
+
+_SHORTEST_PATH_QUERIES: dict[int, str] = {
+    max_hops: _SHORTEST_PATH_QUERY.format(max_hops=max_hops)
+    for max_hops in range(1, _SHORTEST_PATH_MAX_HOPS + 1)
+}
+
+
+def process_node(node: Node) -> GraphNode:
     """Process a Neo4j node into a GraphNode.
 
+    Shared with the search and Cypher routers so every endpoint shapes nodes
+    the same way.
+
     Args:
         node: Neo4j node object.
 
     Returns:
         GraphNode instance.
     """
-    properties = dict(node.items())
-    node_id = properties.pop("node_id", 0)
+    # Read node_id and copy the remaining properties in one pass
+    node_id = node.get("node_id", 0)
+    properties = {k: v for k, v in node.items() if k != "node_id"}
     labels = list(node.labels)
     label = labels[0] if labels else "Unknown"
 
-    return GraphNode(
+    # Values come typed from the driver, so skip validation
+    return GraphNode.model_construct(
         id=node.element_id,
         node_id=node_id,
         label=label,
@@ -80,7 +114,7 @@ async def _process_path_results(session, result) -> SubgraphResponse:
         # Process nodes in the path
         for node in path.nodes:
             if node.element_id not in nodes_dict:
-                nodes_dict[node.element_id] = _process_node(node)
+                nodes_dict[node.element_id] = process_node(node)
 
         # Process relationships in the path
         for rel in path.relationships:
@@ -111,10 +145,10 @@ async def _process_neighbor_results(result) -> SubgraphResponse:
         rel = record.get("r")
 
         if start_node is not None and start_node.element_id not in nodes_dict:
-            nodes_dict[start_node.element_id] = _process_node(start_node)
+            nodes_dict[start_node.element_id] = process_node(start_node)
 
         if neighbor_node is not None and neighbor_node.element_id not in nodes_dict:
-            nodes_dict[neighbor_node.element_id] = _process_node(neighbor_node)
+            nodes_dict[neighbor_node.element_id] = process_node(neighbor_node)
 
         # Neo4j Node/Relationship objects can be "falsy" when they have no properties.
         # Avoid truthiness checks; explicitly test for None.
@@ -161,6 +195,7 @@ async def _process_relationships_results(result) -> RelationshipsResponse:
 async def get_neighbors(
     node_id: int,
     current_user: Annotated[User, Depends(get_current_active_user)],
+    session: Annotated[AsyncSession, Depends(get_neo4j_session)],
     label: NodeLabel | None = Query(None, description="Filter neighbors by this label"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum neighbors to return"),
 ) -> SubgraphResponse:
@@ -169,6 +204,7 @@ async def get_neighbors(
     Args:
         node_id: The node's node_id property.
         current_user: The authenticated user (injected by dependency).
+        session: Neo4j session for the request (injected by dependency).
         label: Optional label to filter neighbors (not the starting node).
         limit: Maximum number of neighbors to return.
 
@@ -178,34 +214,20 @@ async def get_neighbors(
     settings = get_settings()
     limit = min(limit, settings.MAX_LIMIT)
 
-    if label:
-        # Filter neighbors by label
-        query = f"""
-        MATCH (start {{node_id: $node_id}})-[r]-(neighbor:`{label.value}`)
-        RETURN start, r, neighbor
-        LIMIT $limit
-        """
-    else:
-        # Get all neighbors regardless of label
-        query = """
-        MATCH (start {node_id: $node_id})-[r]-(neighbor)
-        RETURN start, r, neighbor
-        LIMIT $limit
-        """
+    # Filter neighbors by label, or get all neighbors when no label is given
+    query = _NEIGHBORS_QUERIES[label]
 
-    async with get_session() as session:
-        result = await session.run(query, {"node_id": node_id, "limit": limit})
-        response = await _process_neighbor_results(result)
+    result = await session.run(query, {"node_id": node_id, "limit": limit})
+    response = await _process_neighbor_results(result)
 
     if not response.nodes:
         # Check if the starting node exists
         check_query = "MATCH (n {node_id: $node_id}) RETURN n LIMIT 1"
-        async with get_session() as session:
-            check_result = await session.run(check_query, {"node_id": node_id})
-            check_node = None
-            async for record in check_result:
-                check_node = record.get("n")
-                break
+        check_result = await session.run(check_query, {"node_id": node_id})
+        check_node = None
+        async for record in check_result:
+            check_node = record.get("n")
+            break
 
         if not check_node:
             # Node not found - return empty result with 200
@@ -214,7 +236,7 @@ async def get_neighbors(
         # Node exists but has no neighbors (or no neighbors with the specified label)
         # Return just the starting node with no links
         return SubgraphResponse(
-            nodes=[_process_node(check_node)],
+            nodes=[process_node(check_node)],
             links=[],
         )
 
@@ -229,14 +251,18 @@ async def get_neighbors(
 )
 async def find_shortest_path(
     current_user: Annotated[User, Depends(get_current_active_user)],
+    session: Annotated[AsyncSession, Depends(get_neo4j_session)],
     start_node_id: int = Query(..., description="Starting node's node_id"),
     end_node_id: int = Query(..., description="Ending node's node_id"),
-    max_hops: int = Query(4, ge=1, le=10, description="Maximum path length (default: 4)"),
+    max_hops: int = Query(
+        4, ge=1, le=_SHORTEST_PATH_MAX_HOPS, description="Maximum path length (default: 4)"
+    ),
 ) -> SubgraphResponse:
     """Find the shortest path between two nodes.
 
     Args:
         current_user: The authenticated user (injected by dependency).
+        session: Neo4j session for the request (injected by dependency).
         start_node_id: The starting node's node_id property.
         end_node_id: The ending node's node_id property.
         max_hops: Maximum number of hops to search (default: 4).
@@ -244,19 +270,13 @@ async def find_shortest_path(
     Returns:
         SubgraphResponse with nodes and links in the shortest path.
     """
-    query = f"""
-    MATCH path = shortestPath(
-        (start {{node_id: $start_node_id}})-[*1..{max_hops}]-(end {{node_id: $end_node_id}})
-    )
-    RETURN path
-    """
+    query = _SHORTEST_PATH_QUERIES[max_hops]
 
-    async with get_session() as session:
-        result = await session.run(
-            query,
-            {"start_node_id": start_node_id, "end_node_id": end_node_id}
-        )
-        response = await _process_path_results(session, result)
+    result = await session.run(
+        query,
+        {"start_node_id": start_node_id, "end_node_id": end_node_id}
+    )
+    response = await _process_path_results(session, result)
 
     # Return empty result with 200 if no path found
     return response
@@ -272,6 +292,7 @@ async def find_shortest_path(
 async def get_relationships(
     node_id: int,
     current_user: Annotated[User, Depends(get_current_active_user)],
+    session: Annotated[AsyncSession, Depends(get_neo4j_session)],
     rel_type: str | None = Query(None, description="Filter relationships by type"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum relationships to return"),
 ) -> RelationshipsResponse:
@@ -280,6 +301,7 @@ async def get_relationships(
     Args:
         node_id: The node's node_id property.
         current_user: The authenticated user (injected by dependency).
+        session: Neo4j session for the request (injected by dependency).
         rel_type: Optional relationship type to filter.
         limit: Maximum number of relationships to return.
 
@@ -304,9 +326,8 @@ async def get_relationships(
         LIMIT $limit
         """
 
-    async with get_session() as session:
-        result = await session.run(query, {"node_id": node_id, "limit": limit})
-        response = await _process_relationships_results(result)
+    result = await session.run(query, {"node_id": node_id, "limit": limit})
+    response = await _process_relationships_results(result)
 
     return response
 
@@ -1,59 +1,256 @@
 """Search API router for finding nodes by properties."""
 
+import re
+import time
+from collections import OrderedDict
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 
-from app.db.neo4j import get_session
+from app.config import get_settings
+from app.db.neo4j import execute_read_map
 from app.models import (
-    GraphNode,
     NodeLabel,
+    SearchByIdsRequest,
     SearchResponse,
 )
 from app.models.user import User
 from app.auth.dependencies import get_current_active_user
+from app.routers.network import process_node
 
 router = APIRouter(prefix="/search", tags=["search"])
 
+_BY_NODE_ID_MATCH = "MATCH (n{label}) WHERE n.node_id = $node_id RETURN n"
 
-def _neo4j_node_to_graph_node(record: dict, node_key: str = "n") -> GraphNode:
-    """Convert a Neo4j node record to a GraphNode model."""
-    node = record[node_key]
-    
-    # Handle both Neo4j Node objects and dict representations
-    if hasattr(node, 'labels'):
-        # Neo4j Node object
-        properties = dict(node)
-        node_id = properties.pop("node_id", 0)
-        labels = list(node.labels)
-        label = labels[0] if labels else "Unknown"
-        element_id = node.element_id
-    else:
-        # Dict representation (from .data() method)
-        properties = dict(node)
-        node_id = properties.pop("node_id", 0)
-        # Get label and element_id from the record (returned by query)
-        label = record.get("_label", "Unknown")
-        element_id = record.get("_element_id", str(node_id))
-
-    return GraphNode(
-        id=element_id,
-        node_id=node_id,
-        label=label,
-        properties=properties,
+_BY_NODE_IDS_MATCH = "MATCH (n{label}) WHERE n.node_id IN $node_ids RETURN n"
+
+_BY_NAME_QUERY = """
+MATCH (n{label})
+WHERE n.name IS NOT NULL AND toLower(n.name) CONTAINS toLower($name)
+RETURN n
+SKIP $offset LIMIT $limit
+"""
+
+# Full-text candidates are re-checked with the same CONTAINS test as the scan,
+# so both paths return exactly the same nodes.
+_BY_NAME_FULLTEXT_QUERY = """
+CALL db.index.fulltext.queryNodes($index, $search) YIELD node AS n
+WITH n WHERE {label_filter}toLower(n.name) CONTAINS toLower($name)
+RETURN n
+SKIP $offset LIMIT $limit
+"""
+
+# Runs of characters that Lucene's standard tokenizer never splits (for ASCII text)
+_WORD_RE = re.compile(r"\w+")
+
+_PAGINATION = "\nSKIP $offset LIMIT $limit"
+
+
+def _label_clause(label: NodeLabel | None) -> str:
+    """Return the Cypher label filter for a node pattern, or "" for any label."""
+    return f":`{label.value}`" if label else ""
+
+
+def _build_node_id_query(match: str, label: NodeLabel | None, suffix: str = "") -> str:
+    """Build a node_id lookup query for one label or for all labels.
+
+    node_id is indexed per label (by the uniqueness constraints in the import
+    model), and a lookup without a label cannot use those indexes. So the
+    all-labels query runs one labeled lookup per label and unions the results.
+
+    Args:
+        match: MATCH ... RETURN n template with a {label} placeholder.
+        label: Node label to search within, or None for all labels.
+        suffix: Clauses appended after the final RETURN, such as pagination.
+
+    Returns:
+        The Cypher query string.
+    """
+    if label is not None:
+        return match.format(label=_label_clause(label)) + suffix
+
+    lookups = "\n  UNION\n".join(
+        "  " + match.format(label=_label_clause(node_label)) for node_label in NodeLabel
     )
+    return f"CALL {{\n{lookups}\n}}\nRETURN n{suffix}"
+
+
+# Every (label, search by node_id?) combination is known up front, so build the
+# query strings once. Identical strings also let Neo4j reuse its cached plans.
+_SEARCH_QUERIES: dict[tuple[NodeLabel | None, bool], str] = {
+    (label, by_node_id): (
+        _build_node_id_query(_BY_NODE_ID_MATCH, label, _PAGINATION)
+        if by_node_id
+        else _BY_NAME_QUERY.format(label=_label_clause(label))
+    )
+    for label in (None, *NodeLabel)
+    for by_node_id in (True, False)
+}
+
+_BY_NAME_FULLTEXT_QUERIES: dict[NodeLabel | None, str] = {
+    label: _BY_NAME_FULLTEXT_QUERY.format(
+        label_filter=f"n{_label_clause(label)} AND " if label else ""
+    )
+    for label in (None, *NodeLabel)
+}
+
+_BY_NODE_IDS_QUERIES: dict[NodeLabel | None, str] = {
+    label: _build_node_id_query(_BY_NODE_IDS_MATCH, label)
+    for label in (None, *NodeLabel)
+}
+
+class _SearchCache:
+    """LRU cache of search responses bounded by the total number of cached nodes.
+
+    Entries count by their nodes rather than one apiece, since a single name
+    search can hold up to 1000 GraphNodes. Expired entries are dropped as soon
+    as they are looked up.
+    """
+
+    def __init__(self, ttl: float, max_nodes: int):
+        self.ttl = ttl
+        self.max_nodes = max_nodes
+        self._entries: OrderedDict[tuple, tuple[float, SearchResponse]] = OrderedDict()
+        self._nodes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple, now: float) -> SearchResponse | None:
+        """Return a cached response younger than the TTL and mark it recently used."""
+        cached = self._entries.get(key)
+        if cached is None:
+            return None
+        if now - cached[0] >= self.ttl:
+            self._pop(key)
+            return None
+        self._entries.move_to_end(key)
+        return cached[1]
+
+    def put(self, key: tuple, response: SearchResponse, now: float) -> None:
+        """Store a response, evicting least recently used entries beyond max_nodes."""
+        if key in self._entries:
+            self._pop(key)
+        size = len(response.nodes)
+        if size > self.max_nodes:
+            return
+        self._entries[key] = (now, response)
+        self._nodes += size
+        while self._nodes > self.max_nodes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._nodes -= len(evicted.nodes)
+
+    def clear(self) -> int:
+        """Drop every entry and return how many there were."""
+        count = len(self._entries)
+        self._entries.clear()
+        self._nodes = 0
+        return count
+
+    def _pop(self, key: tuple) -> None:
+        _, response = self._entries.pop(key)
+        self._nodes -= len(response.nodes)
+
+
+# Recent search results are reused in process. node_id lookups are exact and the
+# imported graph changes rarely, so they are kept for a few minutes; partial name
+# matches only briefly. POST /admin/cache/invalidate clears them on the instance
+# it reaches, and the TTL bounds how stale other instances can be. Both caches
+# are bounded by the number of nodes they hold.
+_node_id_cache = _SearchCache(ttl=300.0, max_nodes=10_000)
+_name_cache = _SearchCache(ttl=10.0, max_nodes=20_000)
+
+
+def clear_search_caches() -> int:
+    """Drop all cached search responses.
+
+    Returns:
+        Number of cached responses removed.
+    """
+    return _node_id_cache.clear() + _name_cache.clear()
+
+
+def _fulltext_search_string(name: str) -> str | None:
+    """Build a Lucene query matching every indexed name that may contain name.
+
+    Each word of name must appear inside some token, so substring matches that
+    start or end mid-word are still found. Returns None when the index cannot
+    be relied on: non-ASCII text (CJK is indexed per character) or no words.
+
+    Args:
+        name: The user-supplied partial name.
+
+    Returns:
+        The Lucene query string, or None to fall back to a scan.
+    """
+    if not name.isascii():
+        return None
+    words = _WORD_RE.findall(name.lower())
+    if not words:
+        return None
+    return " AND ".join(f"*{word}*" for word in words)
+
+
+async def _search(
+    label: NodeLabel | None,
+    node_id: int | None,
+    name: str | None,
+    limit: int,
+    offset: int,
+) -> SearchResponse:
+    """Search nodes by node_id or name, optionally within a single label.
+
+    Args:
+        label: Node label to search within, or None for all labels.
+        node_id: Search by node_id (exact match). Takes precedence over name.
+        name: Search by name (partial match, case-insensitive).
+        limit: Maximum number of results to return.
+        offset: Number of results to skip for pagination.
+
+    Returns:
+        SearchResponse with matching nodes.
+    """
+    if node_id is not None:
+        query = _SEARCH_QUERIES[(label, True)]
+        params = {"node_id": node_id, "limit": limit, "offset": offset}
+        cache, cache_key = _node_id_cache, (label, node_id, limit, offset)
+    else:
+        query = _SEARCH_QUERIES[(label, False)]
+        params = {"name": name, "limit": limit, "offset": offset}
+        fulltext_index = get_settings().NEO4J_NAME_FULLTEXT_INDEX
+        search = _fulltext_search_string(name) if fulltext_index else None
+        if search is not None:
+            query = _BY_NAME_FULLTEXT_QUERIES[label]
+            params.update(index=fulltext_index, search=search)
+        cache, cache_key = _name_cache, (label, name, limit, offset)
+
+    now = time.monotonic()
+    cached = cache.get(cache_key, now)
+    if cached is not None:
+        return cached
+
+    # Convert the Node objects as records stream in rather than buffering them first
+    nodes = await execute_read_map(query, "n", process_node, params)
+    response = SearchResponse.model_construct(nodes=nodes, total=len(nodes))
+
+    cache.put(cache_key, response, now)
+    return response
 
 
 @router.get(
     "",
     response_model=SearchResponse,
     summary="Search nodes across all labels",
-    description="Search for nodes by node_id or name across all node labels. Requires authentication.",
+    description=(
+        "Search for nodes by node_id or name across all node labels. Requires authentication."
+    ),
 )
 async def search_all(
     current_user: Annotated[User, Depends(get_current_active_user)],
     node_id: int | None = Query(None, description="Search by node_id (exact match)"),
-    name: str | None = Query(None, min_length=1, description="Search by name (partial match, case-insensitive)"),
+    name: str | None = Query(
+        None, min_length=1, description="Search by name (partial match, case-insensitive)"
+    ),
     limit: int = Query(100, ge=1, le=1000, description="Maximum results to return"),
     offset: int = Query(0, ge=0, description="Number of results to skip for pagination"),
 ) -> SearchResponse:
@@ -78,43 +275,53 @@ async def search_all(
             detail="At least one search parameter (node_id or name) is required"
         )
 
-    if node_id is not None:
-        query = """
-        MATCH (n) WHERE n.node_id = $node_id 
-        RETURN n, labels(n)[0] AS _label, elementId(n) AS _element_id 
-        SKIP $offset LIMIT $limit
-        """
-        params = {"node_id": node_id, "limit": limit, "offset": offset}
-    else:
-        query = """
-        MATCH (n)
-        WHERE n.name IS NOT NULL AND toLower(n.name) CONTAINS toLower($name)
-        RETURN n, labels(n)[0] AS _label, elementId(n) AS _element_id
-        SKIP $offset LIMIT $limit
-        """
-        params = {"name": name, "limit": limit, "offset": offset}
+    return await _search(None, node_id, name, limit, offset)
 
-    async with get_session() as session:
-        result = await session.run(query, params)
-        records = await result.data()
 
-    nodes = [_neo4j_node_to_graph_node(record) for record in records]
+@router.post(
+    "/by-ids",
+    response_model=SearchResponse,
+    summary="Look up nodes by a list of node_ids",
+    description=(
+        "Fetch up to 1000 nodes by node_id in a single query, optionally within one label. "
+        "Requires authentication."
+    ),
+)
+async def search_by_ids(
+    request: SearchByIdsRequest,
+    current_user: Annotated[User, Depends(get_current_active_user)],
+) -> SearchResponse:
+    """Look up several nodes by node_id with one Cypher query.
 
-    return SearchResponse(nodes=nodes, total=len(nodes))
+    Args:
+        request: SearchByIdsRequest containing the node_ids and an optional label.
+        current_user: The authenticated user (injected by dependency).
 
+    Returns:
+        SearchResponse with the nodes that were found. Unknown node_ids are omitted.
+    """
+    query = _BY_NODE_IDS_QUERIES[request.label]
+    nodes = await execute_read_map(
+        query, "n", process_node, {"node_ids": request.node_ids}
+    )
+    return SearchResponse.model_construct(nodes=nodes, total=len(nodes))
 
 
 @router.get(
     "/{label}",
     response_model=SearchResponse,
     summary="Search nodes by specific label",
-    description="Search for nodes by node_id or name within a specific label. Requires authentication.",
+    description=(
+        "Search for nodes by node_id or name within a specific label. Requires authentication."
+    ),
 )
 async def search_by_label(
     label: NodeLabel,
     current_user: Annotated[User, Depends(get_current_active_user)],
     node_id: int | None = Query(None, description="Search by node_id (exact match)"),
-    name: str | None = Query(None, min_length=1, description="Search by name (partial match, case-insensitive)"),
+    name: str | None = Query(
+        None, min_length=1, description="Search by name (partial match, case-insensitive)"
+    ),
     limit: int = Query(100, ge=1, le=1000, description="Maximum results to return"),
     offset: int = Query(0, ge=0, description="Number of results to skip for pagination"),
 ) -> SearchResponse:
@@ -140,26 +347,4 @@ async def search_by_label(
             detail="At least one search parameter (node_id or name) is required"
         )
 
-    if node_id is not None:
-        query = f"""
-        MATCH (n:`{label.value}`) WHERE n.node_id = $node_id 
-        RETURN n, labels(n)[0] AS _label, elementId(n) AS _element_id 
-        SKIP $offset LIMIT $limit
-        """
-        params = {"node_id": node_id, "limit": limit, "offset": offset}
-    else:
-        query = f"""
-        MATCH (n:`{label.value}`)
-        WHERE n.name IS NOT NULL AND toLower(n.name) CONTAINS toLower($name)
-        RETURN n, labels(n)[0] AS _label, elementId(n) AS _element_id
-        SKIP $offset LIMIT $limit
-        """
-        params = {"name": name, "limit": limit, "offset": offset}
-
-    async with get_session() as session:
-        result = await session.run(query, params)
-        records = await result.data()
-
-    nodes = [_neo4j_node_to_graph_node(record) for record in records]
-
-    return SearchResponse(nodes=nodes, total=len(nodes))
+    return await _search(label, node_id, name, limit, offset)
@@ -4,12 +4,14 @@ import os
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import AsyncGenerator
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from httpx import ASGITransport, AsyncClient
 from sqlmodel import Session, SQLModel, create_engine
 
+from tests.stubs import MockAsyncResult, StubNode, StubSession, async_return
+
 # Set test environment variables before importing app
 os.environ["NEO4J_URL"] = "neo4j://localhost:7687"
 os.environ["NEO4J_USERNAME"] = "neo4j"
@@ -84,36 +86,51 @@ async def test_client_with_db(mock_neo4j_driver, test_db_session) -> AsyncGenera
                     app.dependency_overrides.clear()
 
 
+@pytest.fixture(autouse=True)
+def clear_search_cache():
+    """Give every test empty search result caches and leave none behind."""
+    from app.routers.search import clear_search_caches
+
+    clear_search_caches()
+    yield
+    clear_search_caches()
+
+
 @pytest.fixture
 def mock_neo4j_driver():
     """Create a mock Neo4j driver."""
     mock_driver = MagicMock()
-    mock_driver.verify_connectivity = AsyncMock(return_value=True)
-    mock_driver.close = AsyncMock()
+    mock_driver.verify_connectivity = async_return(None)
+    mock_driver.close = async_return(None)
+    # Routes that take a session open one even when they return before using it
+    mock_driver.session = lambda **kwargs: StubSession()
     return mock_driver
 
 
 @pytest.fixture
-def mock_neo4j_session():
-    """Create a mock Neo4j session."""
-    mock_session = MagicMock()
-    mock_session.close = AsyncMock()
-    return mock_session
+def mock_neo4j_session(monkeypatch):
+    """Inject a stub session through app.dependency_overrides and return it.
+
+    Tests set `mock_neo4j_session.results` to the results run() should return.
+    """
+    from app.db.neo4j import get_neo4j_session
+    from app.main import app
+
+    session = StubSession()
+    monkeypatch.setitem(app.dependency_overrides, get_neo4j_session, lambda: session)
+    return session
 
 
 @pytest.fixture
-def mock_neo4j_node():
-    """Create a mock Neo4j node."""
-    mock_node = MagicMock()
-    mock_node.element_id = "4:test:123"
-    mock_node.labels = frozenset(["entity"])
-    mock_node.__iter__ = lambda self: iter({"node_id": 12345, "name": "Test Company"}.items())
+def make_neo4j_result():
+    """Return a factory building a mock Neo4j result from a list of record dicts."""
+    return MockAsyncResult
 
-    def mock_items():
-        return {"node_id": 12345, "name": "Test Company"}.items()
 
-    mock_node.items = mock_items
-    return mock_node
+@pytest.fixture
+def mock_neo4j_node():
+    """Create a stub Neo4j node."""
+    return StubNode("4:test:123", ["entity"], {"node_id": 12345, "name": "Test Company"})
 
 
 @pytest.fixture
@@ -0,0 +1,125 @@
+"""Lightweight stand-ins for Neo4j driver objects used across the tests."""
+
+
+class StubSession:
+    """Stand-in for a Neo4j AsyncSession that replays preset results.
+
+    Each run() call returns the next entry of `results` and records the query
+    and parameters in `queries`.
+    """
+
+    def __init__(self):
+        self.results: list = []
+        self.queries: list[tuple[str, dict | None]] = []
+
+    async def run(self, query: str, parameters: dict | None = None, **kwargs):
+        self.queries.append((query, parameters))
+        return self.results.pop(0)
+
+    async def close(self) -> None:
+        pass
+
+
+class StubNode:
+    """Lightweight stand-in for neo4j.graph.Node.
+
+    Like the real Node, it exposes its properties as a read-only mapping and is
+    falsy when it has none.
+    """
+
+    __slots__ = ("element_id", "labels", "_properties", "_items")
+
+    def __init__(self, element_id: str, labels, properties: dict):
+        self.element_id = element_id
+        # The routers only iterate labels, so a tuple is enough and keeps the order
+        self.labels = tuple(labels)
+        self._properties = properties
+        # Built once; the routers read items() for every node they convert
+        self._items = tuple(properties.items())
+
+    def __iter__(self):
+        return iter(self._properties)
+
+    def __len__(self) -> int:
+        return len(self._properties)
+
+    def __getitem__(self, key: str):
+        return self._properties[key]
+
+    def get(self, key: str, default=None):
+        return self._properties.get(key, default)
+
+    def keys(self):
+        return self._properties.keys()
+
+    def items(self):
+        return self._items
+
+
+class StubRelationship(StubNode):
+    """Lightweight stand-in for neo4j.graph.Relationship."""
+
+    __slots__ = ("type", "start_node", "end_node")
+
+    def __init__(self, element_id: str, rel_type: str, start_node, end_node, properties: dict):
+        super().__init__(element_id, (), properties)
+        self.type = rel_type
+        self.start_node = start_node
+        self.end_node = end_node
+
+
+class StubPath:
+    """Lightweight stand-in for neo4j.graph.Path."""
+
+    __slots__ = ("nodes", "relationships")
+
+    def __init__(self, nodes: list, relationships: list):
+        self.nodes = nodes
+        self.relationships = relationships
+
+
+class MockAsyncResult:
+    """Stand-in for neo4j.AsyncResult built from a list of record dicts.
+
+    Supports `async for record in result:` (records are the dicts themselves,
+    which provide the `.get(key)` the routers use) as well as keys(), data()
+    and values().
+    """
+
+    def __init__(self, records: list[dict]):
+        self.records = records
+
+    def keys(self) -> list[str]:
+        return list(self.records[0]) if self.records else []
+
+    async def data(self) -> list[dict]:
+        return [dict(record) for record in self.records]
+
+    async def values(self) -> list[list]:
+        return [list(record.values()) for record in self.records]
+
+    async def __aiter__(self):
+        for record in self.records:
+            yield record
+
+
+def async_return(value):
+    """Return a coroutine function that ignores its arguments and returns value.
+
+    A cheaper stand-in for AsyncMock(return_value=value) where the calls are
+    never inspected.
+    """
+
+    async def returns(*args, **kwargs):
+        return value
+
+    return returns
+
+
+def map_values(values):
+    """Build a stand-in for execute_read_map that converts the given values."""
+
+    async def execute_read_map(query, key, func, parameters=None):
+        return [func(value) for value in values]
+
+    return execute_read_map
@@ -0,0 +1,46 @@
+"""Tests for the Admin API endpoints."""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from tests.stubs import map_values
+
+
+class TestInvalidateCaches:
+    """Tests for the cache invalidation endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_invalidate_clears_search_cache(
+        self, authenticated_test_client, mock_authenticated_user, mock_neo4j_node
+    ):
+        """Test that a cached node_id lookup is fetched again after invalidation."""
+        mock_authenticated_user.is_admin = True
+
+        with patch("app.routers.search.execute_read_map", new_callable=AsyncMock) as mock_execute_read:
+            mock_execute_read.side_effect = map_values([mock_neo4j_node])
+
+            await authenticated_test_client.get("/api/v1/search?node_id=12345")
+            await authenticated_test_client.get("/api/v1/search?node_id=12345")
+            assert mock_execute_read.await_count == 1
+
+            response = await authenticated_test_client.post("/api/v1/admin/cache/invalidate")
+
+            assert response.status_code == 200
+            assert "1 cached search result" in response.json()["message"]
+
+            await authenticated_test_client.get("/api/v1/search?node_id=12345")
+            assert mock_execute_read.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_requires_admin(self, authenticated_test_client):
+        """Test that non-admin users cannot invalidate caches."""
+        response = await authenticated_test_client.post("/api/v1/admin/cache/invalidate")
+
+        assert response.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_invalidate_requires_auth(self, test_client):
+        """Test that cache invalidation requires authentication."""
+        response = await test_client.post("/api/v1/admin/cache/invalidate")
+
+        assert response.status_code == 401
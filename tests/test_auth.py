@@ -1,7 +1,6 @@
 """Tests for the Authentication API endpoints."""
 
 import pytest
-from unittest.mock import patch, MagicMock
 from datetime import datetime, timedelta, timezone
 
 from sqlmodel import Session
@@ -341,43 +340,16 @@ class TestProtectedEndpoints:
         assert response.status_code == 401
 
     @pytest.mark.asyncio
-    async def test_cypher_execute_with_auth(self, authenticated_test_client):
+    async def test_cypher_execute_with_auth(
+        self, authenticated_test_client, make_neo4j_result, mock_neo4j_session
+    ):
         """Test that authenticated users can access cypher endpoint."""
-        from unittest.mock import AsyncMock
-
-        class MockAsyncIterator:
-            def __init__(self, items):
-                self.items = items
-                self.index = 0
-
-            def __aiter__(self):
-                return self
-
-            async def __anext__(self):
-                if self.index >= len(self.items):
-                    raise StopAsyncIteration
-                item = self.items[self.index]
-                self.index += 1
-                return item
-
-        mock_result = MagicMock()
-        mock_result.keys = MagicMock(return_value=["count"])
-        mock_result.__aiter__ = lambda self: MockAsyncIterator([{"count": 100}])
-
-        mock_session = MagicMock()
-        mock_session.run = AsyncMock(return_value=mock_result)
-        mock_session.close = AsyncMock()
-
-        with patch("app.routers.cypher.get_session") as mock_get_session:
-            mock_context = MagicMock()
-            mock_context.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_context.__aexit__ = AsyncMock(return_value=None)
-            mock_get_session.return_value = mock_context
-
-            response = await authenticated_test_client.post(
-                "/api/v1/cypher/execute",
-                json={"query": "MATCH (n) RETURN count(n) AS count"},
-            )
-
-            # Should succeed (not 401)
-            assert response.status_code == 200
+        mock_neo4j_session.results = [make_neo4j_result([{"count": 100}])]
+
+        response = await authenticated_test_client.post(
+            "/api/v1/cypher/execute",
+            json={"query": "MATCH (n) RETURN count(n) AS count"},
+        )
+
+        # Should succeed (not 401)
+        assert response.status_code == 200
@@ -3,95 +3,72 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from neo4j.graph import Node, Relationship
+
+from tests.stubs import async_return
+
 
 def create_mock_node(element_id, labels, properties):
     """Create a mock Neo4j node."""
-    mock_node = MagicMock()
+    mock_node = MagicMock(spec=Node)
     mock_node.element_id = element_id
-    mock_node.labels = frozenset(labels)
-    mock_node.__iter__ = lambda self: iter(properties.items())
+    mock_node.labels = tuple(labels)
+    mock_node.__iter__ = lambda self: iter(properties)
+    mock_node.__len__ = lambda self: len(properties)
+    mock_node.__getitem__ = lambda self, key: properties[key]
+    mock_node.get = lambda key, default=None: properties.get(key, default)
+    mock_node.keys = lambda: properties.keys()
     mock_node.items = lambda: properties.items()
     return mock_node
 
 
 def create_mock_relationship(element_id, rel_type, start_node, end_node, properties):
     """Create a mock Neo4j relationship."""
-    mock_rel = MagicMock()
+    mock_rel = MagicMock(spec=Relationship)
     mock_rel.element_id = element_id
     mock_rel.type = rel_type
     mock_rel.start_node = start_node
     mock_rel.end_node = end_node
+    mock_rel.__iter__ = lambda self: iter(properties)
+    mock_rel.__len__ = lambda self: len(properties)
+    mock_rel.__getitem__ = lambda self, key: properties[key]
+    mock_rel.get = lambda key, default=None: properties.get(key, default)
+    mock_rel.keys = lambda: properties.keys()
     mock_rel.items = lambda: properties.items()
-    mock_rel.__iter__ = lambda self: iter(properties.items())
-    # Remove labels attribute to differentiate from nodes
-    del mock_rel.labels
     return mock_rel
 
 
-class MockAsyncIterator:
-    """Mock async iterator for Neo4j results."""
-    def __init__(self, items):
-        self.items = items
-        self.index = 0
-
-    def __aiter__(self):
-        return self
-
-    async def __anext__(self):
-        if self.index >= len(self.items):
-            raise StopAsyncIteration
-        item = self.items[self.index]
-        self.index += 1
-        # Create a mock record with values() method
-        mock_record = MagicMock()
-        if isinstance(item, dict):
-            mock_record.values = MagicMock(return_value=list(item.values()))
-        else:
-            mock_record.values = MagicMock(return_value=[item])
-        return mock_record
-
-
 class TestExecuteCypher:
     """Tests for the execute Cypher endpoint."""
 
     @pytest.mark.asyncio
-    async def test_execute_valid_query(self, authenticated_test_client):
+    async def test_execute_valid_query(
+        self, authenticated_test_client, make_neo4j_result, mock_neo4j_session
+    ):
         """Test executing a valid Cypher query returning nodes."""
         node1 = create_mock_node("4:test:1", ["entity"], {"node_id": 12345, "name": "Company A"})
         node2 = create_mock_node("4:test:2", ["officer"], {"node_id": 12346, "name": "Person B"})
         # Use the same node objects in the relationship to avoid duplication
         rel = create_mock_relationship("5:test:1", "役員", node2, node1, {})
 
-        mock_result = MagicMock()
-        mock_result.keys = MagicMock(return_value=["n", "r", "m"])
-        mock_result.__aiter__ = lambda self: MockAsyncIterator([{"n": node1, "r": rel, "m": node2}])
-
-        mock_session = MagicMock()
-        mock_session.run = AsyncMock(return_value=mock_result)
-        mock_session.close = AsyncMock()
-
-        with patch("app.routers.cypher.get_session") as mock_get_session:
-            mock_context = MagicMock()
-            mock_context.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_context.__aexit__ = AsyncMock(return_value=None)
-            mock_get_session.return_value = mock_context
+        mock_neo4j_session.results = [make_neo4j_result([{"n": node1, "r": rel, "m": node2}])]
 
-            response = await authenticated_test_client.post(
-                "/api/v1/cypher/execute",
-                json={"query": "MATCH (n)-[r]-(m) RETURN n, r, m LIMIT 1"}
-            )
+        response = await authenticated_test_client.post(
+            "/api/v1/cypher/execute",
+            json={"query": "MATCH (n)-[r]-(m) RETURN n, r, m LIMIT 1"}
+        )
 
-            assert response.status_code == 200
-            data = response.json()
-            assert "components" in data
-            assert "total_nodes" in data
-            assert "total_links" in data
-            assert "component_count" in data
-            # Should have at least 2 nodes and 1 link in 1 component
-            # Note: relationship's start_node/end_node might add extra nodes
-            assert data["total_nodes"] >= 2
-            assert data["total_links"] == 1
-            assert data["component_count"] == 1
+        assert response.status_code == 200
+        data = response.json()
+        assert "components" in data
+        assert "total_nodes" in data
+        assert "total_links" in data
+        assert "component_count" in data
+        # Should have at least 2 nodes and 1 link in 1 component
+        # Note: relationship's start_node/end_node might add extra nodes
+        assert data["total_nodes"] >= 2
+        assert data["total_links"] == 1
+        assert data["component_count"] == 1
 
     @pytest.mark.asyncio
     async def test_execute_empty_query(self, authenticated_test_client):
@@ -106,66 +83,49 @@ class TestExecuteCypher:
         assert "empty" in data["detail"].lower()
 
     @pytest.mark.asyncio
-    async def test_execute_with_parameters(self, authenticated_test_client):
+    async def test_execute_with_parameters(
+        self, authenticated_test_client, make_neo4j_result, mock_neo4j_session
+    ):
         """Test executing query with parameters."""
-        mock_result = MagicMock()
-        mock_result.keys = MagicMock(return_value=["n"])
-        mock_result.__aiter__ = lambda self: MockAsyncIterator([])
-
-        mock_session = MagicMock()
-        mock_session.run = AsyncMock(return_value=mock_result)
-        mock_session.close = AsyncMock()
-
-        with patch("app.routers.cypher.get_session") as mock_get_session:
-            mock_context = MagicMock()
-            mock_context.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_context.__aexit__ = AsyncMock(return_value=None)
-            mock_get_session.return_value = mock_context
+        mock_neo4j_session.results = [make_neo4j_result([])]
 
-            response = await authenticated_test_client.post(
-                "/api/v1/cypher/execute",
-                json={
-                    "query": "MATCH (n {node_id: $id}) RETURN n",
-                    "parameters": {"id": 12345}
-                }
-            )
+        response = await authenticated_test_client.post(
+            "/api/v1/cypher/execute",
+            json={
+                "query": "MATCH (n {node_id: $id}) RETURN n",
+                "parameters": {"id": 12345}
+            }
+        )
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["total_nodes"] == 0
-            assert data["component_count"] == 0
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_nodes"] == 0
+        assert data["component_count"] == 0
 
     @pytest.mark.asyncio
-    async def test_execute_multiple_components(self, authenticated_test_client):
+    async def test_execute_multiple_components(
+        self, authenticated_test_client, make_neo4j_result, mock_neo4j_session
+    ):
         """Test that disconnected nodes are returned as separate components."""
         # Two disconnected nodes
         node1 = create_mock_node("4:test:1", ["entity"], {"node_id": 12345, "name": "Company A"})
         node2 = create_mock_node("4:test:2", ["entity"], {"node_id": 12346, "name": "Company B"})
 
-        mock_result = MagicMock()
-        mock_result.keys = MagicMock(return_value=["n"])
-        mock_result.__aiter__ = lambda self: MockAsyncIterator([{"n": node1}, {"n": node2}])
+        mock_neo4j_session.results = [make_neo4j_result([{"n": node1}, {"n": node2}])]
 
-        mock_session = MagicMock()
-        mock_session.run = AsyncMock(return_value=mock_result)
-        mock_session.close = AsyncMock()
-
-        with patch("app.routers.cypher.get_session") as mock_get_session:
-            mock_context = MagicMock()
-            mock_context.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_context.__aexit__ = AsyncMock(return_value=None)
-            mock_get_session.return_value = mock_context
-
-            response = await authenticated_test_client.post(
-                "/api/v1/cypher/execute",
-                json={"query": "MATCH (n:entity) RETURN n LIMIT 2"}
-            )
+        response = await authenticated_test_client.post(
+            "/api/v1/cypher/execute",
+            json={"query": "MATCH (n:entity) RETURN n LIMIT 2"}
+        )
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["total_nodes"] == 2
-            assert data["total_links"] == 0
-            assert data["component_count"] == 2  # Two disconnected nodes
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_nodes"] == 2
+        assert data["total_links"] == 0
+        assert data["component_count"] == 2  # Two disconnected nodes
+        first_node = data["components"][0]["nodes"][0]
+        assert first_node["node_id"] == 12345
+        assert first_node["properties"] == {"name": "Company A"}
 
     @pytest.mark.asyncio
     async def test_execute_dangerous_query_rejected(self, authenticated_test_client):
@@ -174,6 +134,20 @@ class TestExecuteCypher:
             "DELETE n",
             "MATCH (n) DELETE n",
             "DROP INDEX my_index",
+            "match (n) detach delete n",
+            # Keywords inside a literal must not hide a later operation
+            "MATCH (n {note:'create index'}) DETACH DELETE n",
+            "MATCH (n) WHERE n.x = 'CREATE CONSTRAINT' DELETE n",
+            "MATCH (n) WHERE n.x = 'it\\'s' DELETE n",
+            "MATCH (n) // it's\nDETACH DELETE n RETURN 'x'",
+            "MATCH (n) CREATE INDEX FOR (m:entity) ON (m.name)",
+            # Procedures that run Cypher given as a string
+            "CALL apoc.cypher.doIt('MATCH (n) DETACH DELETE n', {}) YIELD value "
+            "RETURN value",
+            "CALL apoc.periodic.iterate('MATCH (n) RETURN n', 'DETACH DELETE n', "
+            "{batchSize: 1000})",
+            "CALL apoc.cypher.doIt('MATCH (n) ' + 'DETACH DELETE' + ' n', {}) YIELD value "
+            "RETURN value",
         ]
 
         for query in dangerous_queries:
@@ -184,6 +158,71 @@ class TestExecuteCypher:
 
             assert response.status_code == 403, f"Query should be rejected: {query}"
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("query", "expected"),
+        [
+            (
+                "MATCH (n {note: 'drop'}) DETACH DELETE n WITH 1 AS x DROP INDEX idx",
+                "DETACH DELETE, DROP INDEX.",
+            ),
+            ("MATCH (n) // it's\nDETACH DELETE n RETURN 'drop'", "DETACH DELETE."),
+            ("CALL apoc.cypher.doIt('DELETE', {}) YIELD value RETURN 'drop'", "DELETE, DROP."),
+        ],
+        ids=["quoted_value_skipped", "after_comment", "procedure_call"],
+    )
+    async def test_execute_dangerous_query_reports_every_keyword(
+        self, authenticated_test_client, query, expected
+    ):
+        """Test that the rejection names each forbidden operation in the query."""
+        response = await authenticated_test_client.post(
+            "/api/v1/cypher/execute",
+            json={"query": query}
+        )
+
+        assert response.status_code == 403
+        detail = response.json()["detail"]
+        assert detail == (
+            f"Query contains forbidden operation: {expected} Only read operations are allowed."
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_keyword_in_string_literal_allowed(
+        self, authenticated_test_client, make_neo4j_result, mock_neo4j_session
+    ):
+        """Test that read queries may mention dangerous keywords in property values."""
+        allowed_queries = [
+            "MATCH (n) WHERE n.name CONTAINS 'delete' RETURN n",
+            'MATCH (n) WHERE n.note = "drop" RETURN n',
+            "MATCH (n {note: 'create index'}) RETURN n",
+        ]
+        mock_neo4j_session.results = [make_neo4j_result([]) for _ in allowed_queries]
+
+        for query in allowed_queries:
+            response = await authenticated_test_client.post(
+                "/api/v1/cypher/execute",
+                json={"query": query}
+            )
+
+            assert response.status_code == 200, f"Query should be allowed: {query}"
+
+    @pytest.mark.asyncio
+    async def test_execute_session_is_read_only(self, mock_neo4j_driver):
+        """Test that routes receive sessions the server will not let write."""
+        from neo4j import READ_ACCESS
+
+        from app.db.neo4j import get_neo4j_session
+        from tests.stubs import StubSession
+
+        opened = []
+        mock_neo4j_driver.session = lambda **kwargs: opened.append(kwargs) or StubSession()
+
+        with patch("app.db.neo4j.Neo4jConnection._driver", mock_neo4j_driver):
+            async for _ in get_neo4j_session():
+                pass
+
+        assert opened == [{"default_access_mode": READ_ACCESS}]
+
     @pytest.mark.asyncio
     async def test_execute_requires_auth(self, test_client):
         """Test that execute endpoint requires authentication."""
@@ -201,50 +240,16 @@ class TestGetSchema:
     @pytest.mark.asyncio
     async def test_get_schema(self, authenticated_test_client):
         """Test getting database schema."""
+        results = {
+            ("CALL db.labels()", "label"): ["entity", "officer"],
+            ("CALL db.relationshipTypes()", "relationshipType"): ["officer_of"],
+            ("CALL db.propertyKeys()", "propertyKey"): ["name"],
+        }
 
-        class MockAsyncIterator:
-            def __init__(self, items):
-                self.items = items
-                self.index = 0
-
-            def __aiter__(self):
-                return self
-
-            async def __anext__(self):
-                if self.index >= len(self.items):
-                    raise StopAsyncIteration
-                item = self.items[self.index]
-                self.index += 1
-                return item
-
-        mock_labels_result = MagicMock()
-        mock_labels_result.__aiter__ = lambda self: MockAsyncIterator([
-            {"label": "entity"}, {"label": "officer"}
-        ])
-
-        mock_rels_result = MagicMock()
-        mock_rels_result.__aiter__ = lambda self: MockAsyncIterator([
-            {"relationshipType": "officer_of"}
-        ])
-
-        mock_props_result = MagicMock()
-        mock_props_result.__aiter__ = lambda self: MockAsyncIterator([
-            {"propertyKey": "name"}
-        ])
-
-        mock_session = MagicMock()
-        mock_session.run = AsyncMock(side_effect=[
-            mock_labels_result,
-            mock_rels_result,
-            mock_props_result
-        ])
-        mock_session.close = AsyncMock()
-
-        with patch("app.routers.cypher.get_session") as mock_get_session:
-            mock_context = MagicMock()
-            mock_context.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_context.__aexit__ = AsyncMock(return_value=None)
-            mock_get_session.return_value = mock_context
+        with patch(
+            "app.routers.cypher.execute_read_values", new_callable=AsyncMock
+        ) as mock_execute_read, patch("app.routers.cypher._schema_cache", None):
+            mock_execute_read.side_effect = lambda query, key: results[(query, key)]
 
             response = await authenticated_test_client.get("/api/v1/cypher/schema")
 
@@ -253,6 +258,16 @@ class TestGetSchema:
             assert "node_labels" in data
             assert "relationship_types" in data
             assert "property_keys" in data
+            assert data["node_labels"] == ["entity", "officer"]
+            assert data["relationship_types"] == ["officer_of"]
+            assert data["property_keys"] == ["name"]
+
+            # A second request is served from the cache without querying Neo4j
+            cached_response = await authenticated_test_client.get("/api/v1/cypher/schema")
+
+            assert cached_response.status_code == 200
+            assert cached_response.json() == data
+            assert mock_execute_read.await_count == 3
 
     @pytest.mark.asyncio
     async def test_get_schema_requires_auth(self, test_client):
@@ -267,31 +282,45 @@ class TestGetStats:
     @pytest.mark.asyncio
     async def test_get_stats(self, authenticated_test_client):
         """Test getting database statistics."""
-        mock_record = MagicMock()
-        mock_record.__getitem__ = lambda self, key: {"nodeCount": 1000, "relationshipCount": 5000}[key]
-
-        mock_result = MagicMock()
-        mock_result.single = AsyncMock(return_value=mock_record)
-
-        mock_session = MagicMock()
-        mock_session.run = AsyncMock(return_value=mock_result)
-        mock_session.close = AsyncMock()
-
-        with patch("app.routers.cypher.get_session") as mock_get_session:
-            mock_context = MagicMock()
-            mock_context.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_context.__aexit__ = AsyncMock(return_value=None)
-            mock_get_session.return_value = mock_context
+        stats = [{"nodeCount": 1000, "relationshipCount": 5000}]
+        with patch("app.routers.cypher.execute_read", async_return(stats)):
 
             response = await authenticated_test_client.get("/api/v1/cypher/stats")
 
             assert response.status_code == 200
             data = response.json()
-            assert "node_count" in data
-            assert "relationship_count" in data
+            assert data["node_count"] == 1000
+            assert data["relationship_count"] == 5000
 
     @pytest.mark.asyncio
     async def test_get_stats_requires_auth(self, test_client):
         """Test that stats endpoint requires authentication."""
         response = await test_client.get("/api/v1/cypher/stats")
         assert response.status_code == 401
+
+
+class TestFindConnectedComponents:
+    """Tests for the connected components helper."""
+
+    def test_long_chain_is_single_component(self):
+        """Test that a long chain of links does not hit the recursion limit."""
+        from app.models.graph import GraphLink, GraphNode
+        from app.routers.cypher import _find_connected_components
+
+        count = 5000
+        nodes = {
+            f"4:test:{i}": GraphNode(id=f"4:test:{i}", node_id=i, label="entity")
+            for i in range(count)
+        }
+        links = {
+            f"5:test:{i}": GraphLink(
+                id=f"5:test:{i}", source=f"4:test:{i}", target=f"4:test:{i + 1}", type="役員"
+            )
+            for i in range(count - 1)
+        }
+
+        components = _find_connected_components(nodes, links)
+
+        assert len(components) == 1
+        assert len(components[0].nodes) == count
+        assert len(components[0].links) == count - 1
@@ -3,6 +3,16 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from tests.stubs import async_return
+
+
+@pytest.fixture(autouse=True)
+def reset_health_cache(monkeypatch):
+    """Clear the cached connectivity result so each test checks afresh."""
+    import app.main
+
+    monkeypatch.setattr(app.main, "_health_cache", None)
+
 
 class TestRootEndpoint:
     """Tests for the root endpoint."""
@@ -26,8 +36,7 @@ class TestHealthEndpoint:
     @pytest.mark.asyncio
     async def test_health_check_returns_status(self, test_client):
         """Test that health endpoint returns status information."""
-        with patch("app.main.Neo4jConnection.verify_connectivity", new_callable=AsyncMock) as mock_verify:
-            mock_verify.return_value = True
+        with patch("app.main.Neo4jConnection.verify_connectivity", async_return(True)):
 
             response = await test_client.get("/health")
 
@@ -40,8 +49,7 @@ class TestHealthEndpoint:
     @pytest.mark.asyncio
     async def test_health_check_degraded_when_db_disconnected(self, test_client):
         """Test that health returns degraded status when DB is disconnected."""
-        with patch("app.main.Neo4jConnection.verify_connectivity", new_callable=AsyncMock) as mock_verify:
-            mock_verify.return_value = False
+        with patch("app.main.Neo4jConnection.verify_connectivity", async_return(False)):
 
             response = await test_client.get("/health")
 
@@ -50,6 +58,19 @@ class TestHealthEndpoint:
             assert data["status"] == "degraded"
             assert data["database"] == "disconnected"
 
+    @pytest.mark.asyncio
+    async def test_health_check_reuses_recent_result(self, test_client):
+        """Test that consecutive probes within the TTL share one connectivity check."""
+        with patch("app.main.Neo4jConnection.verify_connectivity", new_callable=AsyncMock) as mock_verify:
+            mock_verify.return_value = True
+
+            first = await test_client.get("/health")
+            second = await test_client.get("/ready")
+
+            assert first.json()["status"] == "healthy"
+            assert second.json()["status"] == "ready"
+            assert mock_verify.await_count == 1
+
 
 class TestLivenessEndpoint:
     """Tests for the liveness check endpoint."""
@@ -70,8 +91,7 @@ class TestReadinessEndpoint:
     @pytest.mark.asyncio
     async def test_readiness_check_ready(self, test_client):
         """Test that readiness endpoint returns ready when DB is connected."""
-        with patch("app.main.Neo4jConnection.verify_connectivity", new_callable=AsyncMock) as mock_verify:
-            mock_verify.return_value = True
+        with patch("app.main.Neo4jConnection.verify_connectivity", async_return(True)):
 
             response = await test_client.get("/ready")
 
@@ -82,11 +102,31 @@ class TestReadinessEndpoint:
     @pytest.mark.asyncio
     async def test_readiness_check_not_ready(self, test_client):
         """Test that readiness endpoint returns not ready when DB is disconnected."""
-        with patch("app.main.Neo4jConnection.verify_connectivity", new_callable=AsyncMock) as mock_verify:
-            mock_verify.return_value = False
+        with patch("app.main.Neo4jConnection.verify_connectivity", async_return(False)):
 
             response = await test_client.get("/ready")
 
             assert response.status_code == 200
             data = response.json()
             assert data["status"] == "not ready"
+
+
+class TestCompression:
+    """Tests for response compression."""
+
+    @pytest.mark.asyncio
+    async def test_large_response_is_gzipped(self, test_client):
+        """Test that responses above the size threshold are gzip encoded."""
+        response = await test_client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert "paths" in response.json()
+
+    @pytest.mark.asyncio
+    async def test_small_response_is_not_compressed(self, test_client):
+        """Test that small responses are sent uncompressed."""
+        response = await test_client.get("/live", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
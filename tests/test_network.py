@@ -1,224 +1,111 @@
 """Tests for the Network Traversal API endpoints."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
-
-
-def create_mock_path(nodes, relationships):
-    """Create a mock Neo4j path object."""
-    mock_path = MagicMock()
-    mock_path.nodes = nodes
-    mock_path.relationships = relationships
-    return mock_path
-
-
-def create_mock_node(element_id, labels, properties):
-    """Create a mock Neo4j node."""
-    mock_node = MagicMock()
-    mock_node.element_id = element_id
-    mock_node.labels = frozenset(labels)
-
-    def mock_items():
-        return properties.items()
-
-    mock_node.items = mock_items
-    return mock_node
-
-
-def create_mock_relationship(element_id, rel_type, start_node, end_node, properties):
-    """Create a mock Neo4j relationship."""
-    mock_rel = MagicMock()
-    mock_rel.element_id = element_id
-    mock_rel.type = rel_type
-    mock_rel.start_node = start_node
-    mock_rel.end_node = end_node
-
-    def mock_items():
-        return properties.items()
-
-    mock_rel.items = mock_items
-    return mock_rel
-
-
-class AsyncResultIterator:
-    """Async iterator that mimics Neo4j Result behavior.
-    
-    Neo4j's async driver returns results that can be iterated with `async for`.
-    Each item is a Record-like object with a .get() method.
-    """
-
-    def __init__(self, records: list[dict]):
-        self.records = records
-        self.index = 0
-
-    def __aiter__(self):
-        return self
-
-    async def __anext__(self):
-        if self.index >= len(self.records):
-            raise StopAsyncIteration
-        # Create a mock record with .get() method
-        record_data = self.records[self.index]
-        mock_record = MagicMock()
-        mock_record.get = lambda key, default=None: record_data.get(key, default)
-        self.index += 1
-        return mock_record
-
-
-def create_mock_neo4j_result(records: list[dict]):
-    """Create a mock Neo4j result that supports async iteration.
-    
-    This mimics the behavior of neo4j.AsyncResult which:
-    - Can be iterated with `async for record in result:`
-    - Each record has a .get(key) method to retrieve values
-    - Also supports .data() for backward compatibility (returns dicts)
-    """
-    mock_result = MagicMock()
-    # Support for result.data() - returns list of dicts
-    mock_result.data = AsyncMock(return_value=records)
-    # Support for async iteration - returns Record-like objects
-    mock_result.__aiter__ = lambda self: AsyncResultIterator(records)
-    return mock_result
 
+from tests.stubs import StubNode, StubPath, StubRelationship
 
-class TestGetNeighbors:
-    """Tests for the get neighbors endpoint."""
-
-    @pytest.mark.asyncio
-    async def test_get_neighbors(self, authenticated_test_client):
-        """Test getting neighbors of a node."""
-        node1 = create_mock_node("4:test:1", ["entity"], {"node_id": 12345, "name": "Company A"})
-        node2 = create_mock_node("4:test:2", ["officer"], {"node_id": 12346, "name": "Person B"})
-        rel = create_mock_relationship("5:test:1", "役員", node2, node1, {})
-
-        mock_result = create_mock_neo4j_result([{"start": node1, "r": rel, "neighbor": node2}])
+# The routers only read graph objects, so the common company/officer graph is
+# built once at import and shared by the tests below.
+_NODE1 = StubNode("4:test:1", ["entity"], {"node_id": 12345, "name": "Company A"})
+_NODE2 = StubNode("4:test:2", ["officer"], {"node_id": 12346, "name": "Person B"})
+_REL = StubRelationship("5:test:1", "役員", _NODE2, _NODE1, {})
+_PATH = StubPath([_NODE1, _NODE2], [_REL])
 
-        mock_session = MagicMock()
-        mock_session.run = AsyncMock(return_value=mock_result)
-        mock_session.close = AsyncMock()
 
-        with patch("app.routers.network.get_session") as mock_get_session:
-            mock_context = MagicMock()
-            mock_context.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_context.__aexit__ = AsyncMock(return_value=None)
-            mock_get_session.return_value = mock_context
+def _assert_graph_shape(response, node_count: int, link_count: int) -> dict:
+    """Assert a 200 subgraph response with the given counts and return its parsed body."""
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["nodes"]) == node_count
+    assert len(data["links"]) == link_count
+    return data
 
-            response = await authenticated_test_client.get("/api/v1/network/neighbors/12345")
 
-            assert response.status_code == 200
-            data = response.json()
-            assert "nodes" in data
-            assert "links" in data
-            assert len(data["nodes"]) == 2
-            assert len(data["links"]) == 1
+class TestGetNeighbors:
+    """Tests for the get neighbors endpoint."""
 
     @pytest.mark.asyncio
-    async def test_get_neighbors_with_label_filter(self, authenticated_test_client):
-        """Test getting neighbors filtered by label."""
-        node1 = create_mock_node("4:test:1", ["entity"], {"node_id": 12345, "name": "Company A"})
-        node2 = create_mock_node("4:test:2", ["officer"], {"node_id": 12346, "name": "Person B"})
-        rel = create_mock_relationship("5:test:1", "役員", node2, node1, {})
-
-        mock_result = create_mock_neo4j_result([{"start": node1, "r": rel, "neighbor": node2}])
-
-        mock_session = MagicMock()
-        mock_session.run = AsyncMock(return_value=mock_result)
-        mock_session.close = AsyncMock()
-
-        with patch("app.routers.network.get_session") as mock_get_session:
-            mock_context = MagicMock()
-            mock_context.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_context.__aexit__ = AsyncMock(return_value=None)
-            mock_get_session.return_value = mock_context
-
-            response = await authenticated_test_client.get("/api/v1/network/neighbors/12345?label=officer")
-
-            assert response.status_code == 200
-            data = response.json()
-            assert "nodes" in data
-            assert "links" in data
+    @pytest.mark.parametrize(
+        ("url", "expected_pattern"),
+        [
+            ("/api/v1/network/neighbors/12345", "-[r]-(neighbor)"),
+            ("/api/v1/network/neighbors/12345?label=officer", "-[r]-(neighbor:`officer`)"),
+        ],
+        ids=["all_labels", "label_filter"],
+    )
+    async def test_get_neighbors(
+        self,
+        authenticated_test_client,
+        make_neo4j_result,
+        mock_neo4j_session,
+        url,
+        expected_pattern,
+    ):
+        """Test getting neighbors of a node, with and without a label filter."""
+        mock_neo4j_session.results = [
+            make_neo4j_result([{"start": _NODE1, "r": _REL, "neighbor": _NODE2}])
+        ]
+
+        response = await authenticated_test_client.get(url)
+
+        _assert_graph_shape(response, 2, 1)
+        assert expected_pattern in mock_neo4j_session.queries[-1][0]
 
     @pytest.mark.asyncio
-    async def test_get_neighbors_node_not_found(self, authenticated_test_client):
+    async def test_get_neighbors_node_not_found(
+        self, authenticated_test_client, make_neo4j_result, mock_neo4j_session
+    ):
         """Test getting neighbors of a non-existent node returns empty result."""
         # First query returns no results
-        mock_result = create_mock_neo4j_result([])
+        mock_result = make_neo4j_result([])
 
         # Check query also returns no results
-        mock_check_result = create_mock_neo4j_result([])
+        mock_check_result = make_neo4j_result([])
 
-        mock_session = MagicMock()
-        mock_session.run = AsyncMock(side_effect=[mock_result, mock_check_result])
-        mock_session.close = AsyncMock()
+        mock_neo4j_session.results = [mock_result, mock_check_result]
 
-        with patch("app.routers.network.get_session") as mock_get_session:
-            mock_context = MagicMock()
-            mock_context.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_context.__aexit__ = AsyncMock(return_value=None)
-            mock_get_session.return_value = mock_context
+        response = await authenticated_test_client.get("/api/v1/network/neighbors/99999999")
 
-            response = await authenticated_test_client.get("/api/v1/network/neighbors/99999999")
-
-            assert response.status_code == 200
-            data = response.json()
-            assert data["nodes"] == []
-            assert data["links"] == []
+        _assert_graph_shape(response, 0, 0)
 
     @pytest.mark.asyncio
-    async def test_get_neighbors_no_neighbors_with_label(self, authenticated_test_client):
+    async def test_get_neighbors_no_neighbors_with_label(
+        self, authenticated_test_client, make_neo4j_result, mock_neo4j_session
+    ):
         """Test getting neighbors when node exists but has no neighbors with specified label."""
-        node1 = create_mock_node("4:test:1", ["entity"], {"node_id": 12345, "name": "Company A"})
-
         # First query returns no results (no neighbors with label)
-        mock_result = create_mock_neo4j_result([])
+        mock_result = make_neo4j_result([])
 
         # Check query returns the node (node exists)
-        mock_check_result = create_mock_neo4j_result([{"n": node1}])
+        mock_check_result = make_neo4j_result([{"n": _NODE1}])
 
-        mock_session = MagicMock()
-        mock_session.run = AsyncMock(side_effect=[mock_result, mock_check_result])
-        mock_session.close = AsyncMock()
+        mock_neo4j_session.results = [mock_result, mock_check_result]
 
-        with patch("app.routers.network.get_session") as mock_get_session:
-            mock_context = MagicMock()
-            mock_context.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_context.__aexit__ = AsyncMock(return_value=None)
-            mock_get_session.return_value = mock_context
-
-            response = await authenticated_test_client.get("/api/v1/network/neighbors/12345?label=intermediary")
+        response = await authenticated_test_client.get(
+            "/api/v1/network/neighbors/12345?label=intermediary"
+        )
 
-            assert response.status_code == 200
-            data = response.json()
-            # Node exists but no neighbors with the specified label
-            assert len(data["nodes"]) == 1
-            assert data["links"] == []
+        # Node exists but no neighbors with the specified label
+        _assert_graph_shape(response, 1, 0)
 
     @pytest.mark.asyncio
-    async def test_get_neighbors_includes_falsy_relationship(self, authenticated_test_client):
+    async def test_get_neighbors_includes_falsy_relationship(
+        self, authenticated_test_client, make_neo4j_result, mock_neo4j_session
+    ):
         """Regression: include links even if Relationship is falsy (e.g., no properties)."""
-        node1 = create_mock_node("4:test:1", ["officer"], {"node_id": 12345, "name": "Person A"})
-        node2 = create_mock_node("4:test:2", ["address"], {"node_id": 67890, "address": "Somewhere"})
-        rel = create_mock_relationship("5:test:1", "所在地", node1, node2, {})
-        rel.__bool__.return_value = False
-
-        mock_result = create_mock_neo4j_result([{"start": node1, "r": rel, "neighbor": node2}])
-
-        mock_session = MagicMock()
-        mock_session.run = AsyncMock(return_value=mock_result)
-        mock_session.close = AsyncMock()
+        node1 = StubNode("4:test:1", ["officer"], {"node_id": 12345, "name": "Person A"})
+        node2 = StubNode("4:test:2", ["address"], {"node_id": 67890, "address": "Somewhere"})
+        # Like a real Relationship, the stub is falsy when it has no properties
+        rel = StubRelationship("5:test:1", "所在地", node1, node2, {})
+        assert not rel
 
-        with patch("app.routers.network.get_session") as mock_get_session:
-            mock_context = MagicMock()
-            mock_context.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_context.__aexit__ = AsyncMock(return_value=None)
-            mock_get_session.return_value = mock_context
+        mock_neo4j_session.results = [
+            make_neo4j_result([{"start": node1, "r": rel, "neighbor": node2}])
+        ]
 
-            response = await authenticated_test_client.get("/api/v1/network/neighbors/12345")
+        response = await authenticated_test_client.get("/api/v1/network/neighbors/12345")
 
-            assert response.status_code == 200
-            data = response.json()
-            assert len(data["nodes"]) == 2
-            assert len(data["links"]) == 1
+        _assert_graph_shape(response, 2, 1)
 
     @pytest.mark.asyncio
     async def test_get_neighbors_requires_auth(self, test_client):
@@ -231,98 +118,46 @@ class TestShortestPath:
     """Tests for the shortest path endpoint."""
 
     @pytest.mark.asyncio
-    async def test_find_shortest_path_with_default_max_hops(self, authenticated_test_client):
-        """Test finding shortest path with default max_hops (4)."""
-        node1 = create_mock_node("4:test:1", ["entity"], {"node_id": 12345, "name": "Company A"})
-        node2 = create_mock_node("4:test:2", ["officer"], {"node_id": 12346, "name": "Person B"})
-        rel = create_mock_relationship("5:test:1", "役員", node2, node1, {})
-        mock_path = create_mock_path([node1, node2], [rel])
-
-        mock_result = create_mock_neo4j_result([{"path": mock_path}])
-
-        mock_session = MagicMock()
-        mock_session.run = AsyncMock(return_value=mock_result)
-        mock_session.close = AsyncMock()
-
-        with patch("app.routers.network.get_session") as mock_get_session:
-            mock_context = MagicMock()
-            mock_context.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_context.__aexit__ = AsyncMock(return_value=None)
-            mock_get_session.return_value = mock_context
-
-            # Call without max_hops - should use default value of 4
-            response = await authenticated_test_client.get(
-                "/api/v1/network/shortest-path?start_node_id=12345&end_node_id=12346"
-            )
-
-            assert response.status_code == 200
-            data = response.json()
-            assert "nodes" in data
-            assert "links" in data
-
-            # Verify the query was called with max_hops=4 in the path pattern
-            call_args = mock_session.run.call_args
-            query = call_args[0][0]
-            assert "[*1..4]" in query
+    @pytest.mark.parametrize(
+        ("query_string", "expected_pattern"),
+        [
+            ("", "[*1..4]"),
+            ("&max_hops=7", "[*1..7]"),
+        ],
+        ids=["default_max_hops", "custom_max_hops"],
+    )
+    async def test_find_shortest_path(
+        self,
+        authenticated_test_client,
+        make_neo4j_result,
+        mock_neo4j_session,
+        query_string,
+        expected_pattern,
+    ):
+        """Test finding the shortest path with the default (4) and a custom max_hops."""
+        mock_neo4j_session.results = [make_neo4j_result([{"path": _PATH}])]
+
+        response = await authenticated_test_client.get(
+            "/api/v1/network/shortest-path?start_node_id=12345&end_node_id=12346" + query_string
+        )
 
-    @pytest.mark.asyncio
-    async def test_find_shortest_path_with_custom_max_hops(self, authenticated_test_client):
-        """Test finding shortest path with custom max_hops."""
-        node1 = create_mock_node("4:test:1", ["entity"], {"node_id": 12345, "name": "Company A"})
-        node2 = create_mock_node("4:test:2", ["officer"], {"node_id": 12346, "name": "Person B"})
-        rel = create_mock_relationship("5:test:1", "役員", node2, node1, {})
-        mock_path = create_mock_path([node1, node2], [rel])
-
-        mock_result = create_mock_neo4j_result([{"path": mock_path}])
-
-        mock_session = MagicMock()
-        mock_session.run = AsyncMock(return_value=mock_result)
-        mock_session.close = AsyncMock()
-
-        with patch("app.routers.network.get_session") as mock_get_session:
-            mock_context = MagicMock()
-            mock_context.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_context.__aexit__ = AsyncMock(return_value=None)
-            mock_get_session.return_value = mock_context
-
-            # Call with custom max_hops=7
-            response = await authenticated_test_client.get(
-                "/api/v1/network/shortest-path?start_node_id=12345&end_node_id=12346&max_hops=7"
-            )
-
-            assert response.status_code == 200
-            data = response.json()
-            assert "nodes" in data
-            assert "links" in data
-
-            # Verify the query was called with max_hops=7 in the path pattern
-            call_args = mock_session.run.call_args
-            query = call_args[0][0]
-            assert "[*1..7]" in query
+        _assert_graph_shape(response, 2, 1)
+
+        # The path pattern must use the requested max_hops
+        assert expected_pattern in mock_neo4j_session.queries[-1][0]
 
     @pytest.mark.asyncio
-    async def test_shortest_path_not_found(self, authenticated_test_client):
+    async def test_shortest_path_not_found(
+        self, authenticated_test_client, make_neo4j_result, mock_neo4j_session
+    ):
         """Test when no path exists between nodes returns empty result."""
-        mock_result = create_mock_neo4j_result([])
-
-        mock_session = MagicMock()
-        mock_session.run = AsyncMock(return_value=mock_result)
-        mock_session.close = AsyncMock()
-
-        with patch("app.routers.network.get_session") as mock_get_session:
-            mock_context = MagicMock()
-            mock_context.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_context.__aexit__ = AsyncMock(return_value=None)
-            mock_get_session.return_value = mock_context
+        mock_neo4j_session.results = [make_neo4j_result([])]
 
-            response = await authenticated_test_client.get(
-                "/api/v1/network/shortest-path?start_node_id=12345&end_node_id=99999"
-            )
+        response = await authenticated_test_client.get(
+            "/api/v1/network/shortest-path?start_node_id=12345&end_node_id=99999"
+        )
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["nodes"] == []
-            assert data["links"] == []
+        _assert_graph_shape(response, 0, 0)
 
     @pytest.mark.asyncio
     async def test_shortest_path_requires_auth(self, test_client):
@@ -337,105 +172,69 @@ class TestGetRelationships:
     """Tests for the get relationships endpoint."""
 
     @pytest.mark.asyncio
-    async def test_get_relationships(self, authenticated_test_client):
+    async def test_get_relationships(
+        self, authenticated_test_client, make_neo4j_result, mock_neo4j_session
+    ):
         """Test getting relationships of a node."""
-        node1 = create_mock_node("4:test:1", ["entity"], {"node_id": 12345, "name": "Company A"})
-        node2 = create_mock_node("4:test:2", ["officer"], {"node_id": 12346, "name": "Person B"})
-        rel1 = create_mock_relationship("5:test:1", "役員", node2, node1, {})
-        rel2 = create_mock_relationship("5:test:2", "所在地", node1, node2, {"since": "2020"})
-
-        mock_result = create_mock_neo4j_result([{"r": rel1}, {"r": rel2}])
-
-        mock_session = MagicMock()
-        mock_session.run = AsyncMock(return_value=mock_result)
-        mock_session.close = AsyncMock()
+        rel2 = StubRelationship("5:test:2", "所在地", _NODE1, _NODE2, {"since": "2020"})
 
-        with patch("app.routers.network.get_session") as mock_get_session:
-            mock_context = MagicMock()
-            mock_context.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_context.__aexit__ = AsyncMock(return_value=None)
-            mock_get_session.return_value = mock_context
+        mock_neo4j_session.results = [make_neo4j_result([{"r": _REL}, {"r": rel2}])]
 
-            response = await authenticated_test_client.get("/api/v1/network/relationships/12345")
+        response = await authenticated_test_client.get("/api/v1/network/relationships/12345")
 
-            assert response.status_code == 200
-            data = response.json()
-            assert "relationships" in data
-            assert len(data["relationships"]) == 2
+        assert response.status_code == 200
+        data = response.json()
+        assert "relationships" in data
+        assert len(data["relationships"]) == 2
 
     @pytest.mark.asyncio
-    async def test_get_relationships_with_type_filter(self, authenticated_test_client):
+    async def test_get_relationships_with_type_filter(
+        self, authenticated_test_client, make_neo4j_result, mock_neo4j_session
+    ):
         """Test getting relationships filtered by type."""
-        node1 = create_mock_node("4:test:1", ["entity"], {"node_id": 12345, "name": "Company A"})
-        node2 = create_mock_node("4:test:2", ["officer"], {"node_id": 12346, "name": "Person B"})
-        rel = create_mock_relationship("5:test:1", "役員", node2, node1, {})
+        mock_neo4j_session.results = [make_neo4j_result([{"r": _REL}])]
 
-        mock_result = create_mock_neo4j_result([{"r": rel}])
-
-        mock_session = MagicMock()
-        mock_session.run = AsyncMock(return_value=mock_result)
-        mock_session.close = AsyncMock()
-
-        with patch("app.routers.network.get_session") as mock_get_session:
-            mock_context = MagicMock()
-            mock_context.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_context.__aexit__ = AsyncMock(return_value=None)
-            mock_get_session.return_value = mock_context
-
-            response = await authenticated_test_client.get("/api/v1/network/relationships/12345?rel_type=役員")
+        response = await authenticated_test_client.get(
+            "/api/v1/network/relationships/12345?rel_type=役員"
+        )
 
-            assert response.status_code == 200
-            data = response.json()
-            assert "relationships" in data
-            assert len(data["relationships"]) == 1
-            assert data["relationships"][0]["type"] == "役員"
+        assert response.status_code == 200
+        data = response.json()
+        assert "relationships" in data
+        assert len(data["relationships"]) == 1
+        assert data["relationships"][0]["type"] == "役員"
 
     @pytest.mark.asyncio
-    async def test_get_relationships_no_results(self, authenticated_test_client):
+    async def test_get_relationships_no_results(
+        self, authenticated_test_client, make_neo4j_result, mock_neo4j_session
+    ):
         """Test getting relationships when node has none returns empty list."""
-        mock_result = create_mock_neo4j_result([])
+        mock_neo4j_session.results = [make_neo4j_result([])]
 
-        mock_session = MagicMock()
-        mock_session.run = AsyncMock(return_value=mock_result)
-        mock_session.close = AsyncMock()
+        response = await authenticated_test_client.get("/api/v1/network/relationships/99999999")
 
-        with patch("app.routers.network.get_session") as mock_get_session:
-            mock_context = MagicMock()
-            mock_context.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_context.__aexit__ = AsyncMock(return_value=None)
-            mock_get_session.return_value = mock_context
-
-            response = await authenticated_test_client.get("/api/v1/network/relationships/99999999")
-
-            assert response.status_code == 200
-            data = response.json()
-            assert data["relationships"] == []
+        assert response.status_code == 200
+        data = response.json()
+        assert data["relationships"] == []
 
     @pytest.mark.asyncio
-    async def test_get_relationships_includes_falsy_relationship(self, authenticated_test_client):
+    async def test_get_relationships_includes_falsy_relationship(
+        self, authenticated_test_client, make_neo4j_result, mock_neo4j_session
+    ):
         """Regression: include relationships even if Relationship is falsy (e.g., no properties)."""
-        node1 = create_mock_node("4:test:1", ["officer"], {"node_id": 12345, "name": "Person A"})
-        node2 = create_mock_node("4:test:2", ["address"], {"node_id": 67890, "address": "Somewhere"})
-        rel = create_mock_relationship("5:test:1", "所在地", node1, node2, {})
-        rel.__bool__.return_value = False
-
-        mock_result = create_mock_neo4j_result([{"r": rel}])
-
-        mock_session = MagicMock()
-        mock_session.run = AsyncMock(return_value=mock_result)
-        mock_session.close = AsyncMock()
+        node1 = StubNode("4:test:1", ["officer"], {"node_id": 12345, "name": "Person A"})
+        node2 = StubNode("4:test:2", ["address"], {"node_id": 67890, "address": "Somewhere"})
+        # Like a real Relationship, the stub is falsy when it has no properties
+        rel = StubRelationship("5:test:1", "所在地", node1, node2, {})
+        assert not rel
 
-        with patch("app.routers.network.get_session") as mock_get_session:
-            mock_context = MagicMock()
-            mock_context.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_context.__aexit__ = AsyncMock(return_value=None)
-            mock_get_session.return_value = mock_context
+        mock_neo4j_session.results = [make_neo4j_result([{"r": rel}])]
 
-            response = await authenticated_test_client.get("/api/v1/network/relationships/12345")
+        response = await authenticated_test_client.get("/api/v1/network/relationships/12345")
 
-            assert response.status_code == 200
-            data = response.json()
-            assert len(data["relationships"]) == 1
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["relationships"]) == 1
 
     @pytest.mark.asyncio
     async def test_get_relationships_requires_auth(self, test_client):
@@ -3,6 +3,8 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from tests.stubs import map_values
+
 
 class TestSearchAll:
     """Tests for the search all labels endpoint."""
@@ -10,18 +12,8 @@ class TestSearchAll:
     @pytest.mark.asyncio
     async def test_search_by_node_id(self, authenticated_test_client, mock_neo4j_node):
         """Test searching by node_id across all labels."""
-        mock_result = MagicMock()
-        mock_result.data = AsyncMock(return_value=[{"n": mock_neo4j_node}])
-
-        mock_session = MagicMock()
-        mock_session.run = AsyncMock(return_value=mock_result)
-        mock_session.close = AsyncMock()
-
-        with patch("app.routers.search.get_session") as mock_get_session:
-            mock_context = MagicMock()
-            mock_context.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_context.__aexit__ = AsyncMock(return_value=None)
-            mock_get_session.return_value = mock_context
+        with patch("app.routers.search.execute_read_map", new_callable=AsyncMock) as mock_execute_read:
+            mock_execute_read.side_effect = map_values([mock_neo4j_node])
 
             response = await authenticated_test_client.get("/api/v1/search?node_id=12345")
 
@@ -29,22 +21,20 @@ class TestSearchAll:
             data = response.json()
             assert "nodes" in data
             assert "total" in data
+            assert data["nodes"][0]["node_id"] == 12345
+
+            # Without a label, each labeled node_id index is queried and unioned
+            query = mock_execute_read.await_args.args[0]
+            assert "MATCH (n:`officer`) WHERE n.node_id = $node_id RETURN n" in query
+            assert "MATCH (n:`address`) WHERE n.node_id = $node_id RETURN n" in query
+            assert "UNION" in query
+            assert data["nodes"][0]["label"] == "entity"
+            assert data["nodes"][0]["properties"] == {"name": "Test Company"}
 
     @pytest.mark.asyncio
     async def test_search_by_name(self, authenticated_test_client, mock_neo4j_node):
         """Test searching by name across all labels."""
-        mock_result = MagicMock()
-        mock_result.data = AsyncMock(return_value=[{"n": mock_neo4j_node}])
-
-        mock_session = MagicMock()
-        mock_session.run = AsyncMock(return_value=mock_result)
-        mock_session.close = AsyncMock()
-
-        with patch("app.routers.search.get_session") as mock_get_session:
-            mock_context = MagicMock()
-            mock_context.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_context.__aexit__ = AsyncMock(return_value=None)
-            mock_get_session.return_value = mock_context
+        with patch("app.routers.search.execute_read_map", map_values([mock_neo4j_node])):
 
             response = await authenticated_test_client.get("/api/v1/search?name=Test")
 
@@ -53,6 +43,55 @@ class TestSearchAll:
             assert "nodes" in data
             assert "total" in data
 
+    @pytest.mark.asyncio
+    async def test_search_by_name_uses_fulltext_index(self, authenticated_test_client, mock_neo4j_node):
+        """Test that name searches query the configured full-text index."""
+        settings = MagicMock(NEO4J_NAME_FULLTEXT_INDEX="name_fulltext")
+        with patch("app.routers.search.get_settings", return_value=settings), \
+                patch("app.routers.search.execute_read_map", new_callable=AsyncMock) as mock_execute_read:
+            mock_execute_read.side_effect = map_values([mock_neo4j_node])
+
+            response = await authenticated_test_client.get("/api/v1/search?name=Test%20Co.")
+
+            assert response.status_code == 200
+            query, key, func, params = mock_execute_read.await_args.args
+            assert "db.index.fulltext.queryNodes($index, $search)" in query
+            assert params["index"] == "name_fulltext"
+            assert params["search"] == "*test* AND *co*"
+            assert params["name"] == "Test Co."
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("name", ["株式会社", "&"], ids=["non_ascii", "no_words"])
+    async def test_search_by_name_falls_back_to_scan(self, authenticated_test_client, mock_neo4j_node, name):
+        """Test that names the full-text index cannot serve use the CONTAINS scan."""
+        from app.routers.search import _SEARCH_QUERIES
+
+        settings = MagicMock(NEO4J_NAME_FULLTEXT_INDEX="name_fulltext")
+        with patch("app.routers.search.get_settings", return_value=settings), \
+                patch("app.routers.search.execute_read_map", new_callable=AsyncMock) as mock_execute_read:
+            mock_execute_read.side_effect = map_values([mock_neo4j_node])
+
+            response = await authenticated_test_client.get("/api/v1/search", params={"name": name})
+
+            assert response.status_code == 200
+            query, key, func, params = mock_execute_read.await_args.args
+            assert query == _SEARCH_QUERIES[(None, False)]
+            assert params == {"name": name, "limit": 100, "offset": 0}
+
+    @pytest.mark.asyncio
+    async def test_search_reuses_cached_result(self, authenticated_test_client, mock_neo4j_node):
+        """Test that repeating a search within the TTL does not query Neo4j again."""
+        with patch("app.routers.search.execute_read_map", new_callable=AsyncMock) as mock_execute_read:
+            mock_execute_read.side_effect = map_values([mock_neo4j_node])
+
+            first = await authenticated_test_client.get("/api/v1/search?name=Test")
+            second = await authenticated_test_client.get("/api/v1/search?name=Test")
+            other = await authenticated_test_client.get("/api/v1/search?name=Test&offset=1")
+
+            assert first.json() == second.json()
+            assert other.status_code == 200
+            assert mock_execute_read.await_count == 2
+
     @pytest.mark.asyncio
     async def test_search_requires_parameter(self, authenticated_test_client):
         """Test that at least one search parameter is required."""
@@ -65,18 +104,7 @@ class TestSearchAll:
     @pytest.mark.asyncio
     async def test_search_not_found(self, authenticated_test_client):
         """Test searching for non-existent node."""
-        mock_result = MagicMock()
-        mock_result.data = AsyncMock(return_value=[])
-
-        mock_session = MagicMock()
-        mock_session.run = AsyncMock(return_value=mock_result)
-        mock_session.close = AsyncMock()
-
-        with patch("app.routers.search.get_session") as mock_get_session:
-            mock_context = MagicMock()
-            mock_context.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_context.__aexit__ = AsyncMock(return_value=None)
-            mock_get_session.return_value = mock_context
+        with patch("app.routers.search.execute_read_map", map_values([])):
 
             response = await authenticated_test_client.get("/api/v1/search?node_id=99999999")
 
@@ -92,24 +120,62 @@ class TestSearchAll:
         assert response.status_code == 401
 
 
+class TestSearchCache:
+    """Tests for the in-process search result cache."""
+
+    @staticmethod
+    def _response(count):
+        from app.models import GraphNode, SearchResponse
+
+        nodes = [
+            GraphNode.model_construct(id=f"4:test:{i}", node_id=i, label="entity", properties={})
+            for i in range(count)
+        ]
+        return SearchResponse.model_construct(nodes=nodes, total=count)
+
+    def test_expired_entry_is_removed(self):
+        """Test that looking up an expired entry drops it from the cache."""
+        from app.routers.search import _SearchCache
+
+        cache = _SearchCache(ttl=10.0, max_nodes=100)
+        cache.put(("a",), self._response(1), now=0.0)
+
+        assert cache.get(("a",), now=5.0) is not None
+        assert cache.get(("a",), now=10.0) is None
+        assert len(cache) == 0
+
+    def test_evicts_by_total_nodes(self):
+        """Test that least recently used entries are evicted once the node budget is exceeded."""
+        from app.routers.search import _SearchCache
+
+        cache = _SearchCache(ttl=10.0, max_nodes=10)
+        cache.put(("a",), self._response(4), now=0.0)
+        cache.put(("b",), self._response(4), now=0.0)
+        cache.get(("a",), now=1.0)
+        cache.put(("c",), self._response(4), now=1.0)
+
+        assert cache.get(("a",), now=2.0) is not None
+        assert cache.get(("b",), now=2.0) is None
+        assert cache.get(("c",), now=2.0) is not None
+
+    def test_skips_response_larger_than_budget(self):
+        """Test that a response with more nodes than the budget is not cached."""
+        from app.routers.search import _SearchCache
+
+        cache = _SearchCache(ttl=10.0, max_nodes=10)
+        cache.put(("a",), self._response(11), now=0.0)
+
+        assert len(cache) == 0
+
+
 class TestSearchByLabel:
     """Tests for the search by specific label endpoint."""
 
     @pytest.mark.asyncio
     async def test_search_entity_by_node_id(self, authenticated_test_client, mock_neo4j_node):
         """Test searching entity by node_id."""
-        mock_result = MagicMock()
-        mock_result.data = AsyncMock(return_value=[{"n": mock_neo4j_node}])
-
-        mock_session = MagicMock()
-        mock_session.run = AsyncMock(return_value=mock_result)
-        mock_session.close = AsyncMock()
-
-        with patch("app.routers.search.get_session") as mock_get_session:
-            mock_context = MagicMock()
-            mock_context.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_context.__aexit__ = AsyncMock(return_value=None)
-            mock_get_session.return_value = mock_context
+        with patch("app.routers.search.execute_read_map", new_callable=AsyncMock) as mock_execute_read:
+            mock_execute_read.side_effect = map_values([mock_neo4j_node])
 
             response = await authenticated_test_client.get("/api/v1/search/entity?node_id=12345")
 
@@ -118,21 +184,13 @@ class TestSearchByLabel:
             assert "nodes" in data
             assert "total" in data
 
+            query = mock_execute_read.call_args[0][0]
+            assert "MATCH (n:`entity`) WHERE n.node_id = $node_id" in query
+
     @pytest.mark.asyncio
     async def test_search_officer_by_name(self, authenticated_test_client, mock_neo4j_node):
         """Test searching officer by name."""
-        mock_result = MagicMock()
-        mock_result.data = AsyncMock(return_value=[{"n": mock_neo4j_node}])
-
-        mock_session = MagicMock()
-        mock_session.run = AsyncMock(return_value=mock_result)
-        mock_session.close = AsyncMock()
-
-        with patch("app.routers.search.get_session") as mock_get_session:
-            mock_context = MagicMock()
-            mock_context.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_context.__aexit__ = AsyncMock(return_value=None)
-            mock_get_session.return_value = mock_context
+        with patch("app.routers.search.execute_read_map", map_values([mock_neo4j_node])):
 
             response = await authenticated_test_client.get("/api/v1/search/intermediary?name=John")
 
@@ -140,6 +198,22 @@ class TestSearchByLabel:
             data = response.json()
             assert "nodes" in data
 
+    @pytest.mark.asyncio
+    async def test_search_entity_by_name_uses_fulltext_index(self, authenticated_test_client, mock_neo4j_node):
+        """Test that full-text name searches keep only nodes with the requested label."""
+        settings = MagicMock(NEO4J_NAME_FULLTEXT_INDEX="name_fulltext")
+        with patch("app.routers.search.get_settings", return_value=settings), \
+                patch("app.routers.search.execute_read_map", new_callable=AsyncMock) as mock_execute_read:
+            mock_execute_read.side_effect = map_values([mock_neo4j_node])
+
+            response = await authenticated_test_client.get("/api/v1/search/entity?name=Test")
+
+            assert response.status_code == 200
+            query, key, func, params = mock_execute_read.await_args.args
+            assert "db.index.fulltext.queryNodes($index, $search)" in query
+            assert "WITH n WHERE n:`entity` AND toLower(n.name) CONTAINS toLower($name)" in query
+            assert params["search"] == "*test*"
+
     @pytest.mark.asyncio
     async def test_search_label_requires_parameter(self, authenticated_test_client):
         """Test that at least one search parameter is required for label search."""
@@ -157,3 +231,63 @@ class TestSearchByLabel:
         assert response.status_code == 422  # Validation error
 
 
+class TestSearchByIds:
+    """Tests for the multi-id lookup endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_search_by_ids(self, authenticated_test_client, mock_neo4j_node):
+        """Test that all node_ids are fetched with a single query."""
+        with patch("app.routers.search.execute_read_map", new_callable=AsyncMock) as mock_execute_read:
+            mock_execute_read.side_effect = map_values([mock_neo4j_node])
+
+            response = await authenticated_test_client.post(
+                "/api/v1/search/by-ids",
+                json={"node_ids": [12345, 67890], "label": "entity"},
+            )
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data["total"] == 1
+            assert data["nodes"][0]["node_id"] == 12345
+
+            mock_execute_read.assert_awaited_once()
+            query, key, func, params = mock_execute_read.await_args.args
+            assert "MATCH (n:`entity`) WHERE n.node_id IN $node_ids" in query
+            assert params == {"node_ids": [12345, 67890]}
+
+    @pytest.mark.asyncio
+    async def test_search_by_ids_across_labels(self, authenticated_test_client, mock_neo4j_node):
+        """Test that without a label the lookup unions one indexed query per label."""
+        from app.models import NodeLabel
+
+        with patch("app.routers.search.execute_read_map", new_callable=AsyncMock) as mock_execute_read:
+            mock_execute_read.side_effect = map_values([mock_neo4j_node])
+
+            response = await authenticated_test_client.post(
+                "/api/v1/search/by-ids",
+                json={"node_ids": [12345]},
+            )
+
+            assert response.status_code == 200
+            assert response.json()["total"] == 1
+
+            query, key, func, params = mock_execute_read.await_args.args
+            assert query.startswith("CALL {")
+            assert query.count("UNION") == len(NodeLabel) - 1
+            for label in NodeLabel:
+                assert f"MATCH (n:`{label.value}`) WHERE n.node_id IN $node_ids RETURN n" in query
+            assert params == {"node_ids": [12345]}
+
+    @pytest.mark.asyncio
+    async def test_search_by_ids_requires_ids(self, authenticated_test_client):
+        """Test that an empty node_id list is rejected."""
+        response = await authenticated_test_client.post("/api/v1/search/by-ids", json={"node_ids": []})
+
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_search_by_ids_requires_auth(self, test_client):
+        """Test that the multi-id lookup requires authentication."""
+        response = await test_client.post("/api/v1/search/by-ids", json={"node_ids": [12345]})
+
+        assert response.status_code == 401